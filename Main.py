@@ -47,7 +47,7 @@ SessControl.init_model_info()
 # 로그인 상태에 따른 View 초기화
 if not st.session_state[SessionKey.LOGGED_IN]:
     # 다른 페이지의 View 초기화
-    st.session_state[LoginViews.KEY] = LoginViews.LOGIN_BEFORE
+    SessControl.set_view(LoginViews.KEY, LoginViews.LOGIN_BEFORE)
 else:
     # 다른 페이지의 View 초기화
-    st.session_state[LoginViews.KEY] = LoginViews.LOGIN_AFTER
\ No newline at end of file
+    SessControl.set_view(LoginViews.KEY, LoginViews.LOGIN_AFTER)
\ No newline at end of file
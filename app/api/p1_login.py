@@ -8,15 +8,20 @@ Login API 연동 모듈.
 구성
 ----
 - verify_login()       : 로그인 검증 API 호출
-- verify_unique_key()  : 회원가입 시 중복 검사 API 호출
+- verify_unique_key()  : 회원가입 시 중복 검사 API 호출 (@st.cache_data 1분 캐싱, 실패 시 UniqueKeyCheckError)
+- verify_unique_keys_batch() : 유니크 키 3종 중복 검사를 동시 호출로 일괄 처리
 - add_new_user()       : 신규 사용자 생성 API 호출
 - self_block()         : 본인 계정 정지(Soft-delete) API 호출
 - self_update()        : 본인 계정 정보 변경 API 호출
 - Status200            : 2xx 응답 파서 모음(엔드포인트별 성공 페이로드 검증)
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Union
 from requests import Response
 
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
 from app.constants.values import FixValues
 from app.constants.api_urls import LoginAPIKeys
 from app.constants.keys import SessionKey, UserInfo, UserUpdateInfo
@@ -68,6 +73,19 @@ def verify_login(
 # ============================================================
 # 유니크 키(user_id / ktr_id / email) 중복 확인
 # ============================================================
+class UniqueKeyCheckError(Exception):
+    """
+    유니크 키 중복 확인 실패(입력 제약 위반/통신·파싱 오류 등, 중복 여부 None).
+
+    - st.cache_data는 예외를 캐싱하지 않으므로, 실패 결과를 반환 대신 예외로 올려
+      공유 캐시에 실패가 저장되지 않도록 한다.
+    """
+    def __init__(self, msg: Optional[str]):
+        super().__init__(msg)
+        self.msg = msg
+
+
+@st.cache_data(ttl=60, show_spinner=False) # 1분 동안 동일 키 조회를 캐싱하여 재클릭/재실행 시 중복 호출 방지
 def verify_unique_key(
         user_id: Optional[str] = None,
         ktr_id: Optional[str] = None,
@@ -79,13 +97,25 @@ def verify_unique_key(
     제약
     ----
     - 3개 중 정확히 1개만 값이 있어야 함(None/빈문자열("")은 무시).
-    - 위반 시: (None, LoginSignupMsg.UNIQUE_KEY_ONLY_ONE, None) 반환.
+    - 위반 시: UniqueKeyCheckError(LoginSignupMsg.UNIQUE_KEY_ONLY_ONE) 발생.
+
+    캐싱
+    ----
+    - (user_id, ktr_id, email) 인자 조합별로 1분간 결과를 캐싱한다.
+    - 캐시는 프로세스 전역(사용자 공유)이나, 중복 여부는 호출자와 무관하므로 안전하다.
+    - 실패(중복 여부 None)는 예외로 올려 캐싱하지 않는다 (다음 호출 시 다시 조회).
+    - 계정 생성/이메일 변경 등으로 결과가 바뀌면 verify_unique_key.clear()로 무효화한다.
 
     Returns
     -------
     APIResponseOutput
-        (중복 여부[bool|None], 메시지[str|None], {"key": <검사대상>} 또는 None)
+        (중복 여부[bool], 메시지[str|None], {"key": <검사대상>})
         - 예: (False, "[중복 확인] 사용 가능한 ID입니다.", {"key": "user_id"})
+
+    Raises
+    ------
+    UniqueKeyCheckError
+        입력 제약 위반 또는 통신/파싱 실패로 중복 여부를 알 수 없는 경우 (msg 속성에 안내 메시지)
     """
     # 값이 0개 들어가거나, 1개를 초과해서 들어가는 경우를 방어
     provided = {
@@ -93,11 +123,64 @@ def verify_unique_key(
         if v not in (None, "")
     }
     if len(provided) != 1:
-        return None, LoginSignupMsg.UNIQUE_KEY_ONLY_ONE, None
+        raise UniqueKeyCheckError(LoginSignupMsg.UNIQUE_KEY_ONLY_ONE)
 
-    payload = {"user_id":user_id, "ktr_id":ktr_id, "email":email}
+    # API 통신 - 실패 결과는 캐시에 남지 않도록 예외로 전환
+    result = _request_unique_key(user_id=user_id, ktr_id=ktr_id, email=email)
+    if result[0] is None:
+        raise UniqueKeyCheckError(result[1])
+    return result
 
-    # API 통신
+
+def verify_unique_keys_batch(
+        user_id: str,
+        ktr_id: str,
+        email: str
+    ) -> Dict[str, APIResponseOutput]:
+    """
+    유니크 키 3종(user_id/ktr_id/email)의 중복 여부를 한 번에 확인.
+
+    동작
+    ----
+    - BE에 일괄 조회 엔드포인트가 없으므로, 단일 키 조회 3건을 스레드로 동시에 전송한다.
+    - 순차 호출 대비 대기 시간이 왕복 3회 → 1회 수준으로 줄어든다.
+    - 작업 스레드에는 기본적으로 Streamlit 실행 컨텍스트(ScriptRunContext)가 없으므로,
+      스레드 생성 시(initializer) 호출한 스크립트 스레드의 컨텍스트를 연결한다.
+      (APIResponseHandler/Status200 내부의 st.* 접근이 누락·실패하지 않도록 함)
+    - 결과는 세션 단위로 캐싱되므로(SignupKey.BATCH) 캐시 래퍼가 아닌
+      _request_unique_key()를 직접 호출한다.
+
+    Returns
+    -------
+    Dict[str, APIResponseOutput]
+        {"user_id": (중복 여부, 메시지, data), "ktr_id": ..., "email": ...}
+    """
+    targets = {
+        "user_id": {"user_id":user_id},
+        "ktr_id": {"ktr_id":ktr_id},
+        "email": {"email":email},
+    }
+    # 현재 스크립트 스레드의 실행 컨텍스트를 작업 스레드에 그대로 연결
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+            max_workers=len(targets),
+            initializer=add_script_run_ctx,
+            initargs=(None, ctx)
+        ) as pool:
+        futures = {
+            key: pool.submit(_request_unique_key, **kwargs)
+            for key, kwargs in targets.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+
+def _request_unique_key(
+        user_id: Optional[str] = None,
+        ktr_id: Optional[str] = None,
+        email: Optional[str] = None
+    ) -> APIResponseOutput:
+    """유니크 키 중복 확인 API 단건 호출 (입력 제약 검사는 호출자 책임)."""
+    payload = {"user_id":user_id, "ktr_id":ktr_id, "email":email}
     return APIResponseHandler.run(
         url=LoginAPIKeys.VERIFY_UNIQUE_KEY,
         func_200=Status200.verify_unique_key,
@@ -11,9 +11,11 @@
       응답을 실시간으로 파싱하여 UI에 전달.
 """
 from typing import List
+from http.cookiejar import DefaultCookiePolicy
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.constants.api_urls import ChatAPIKeys
 from app.constants.keys import SessionKey
@@ -25,6 +27,14 @@ from bedrock_core.data.sse import SSEConverter
 
 
 
+# 모듈 공용 HTTP 세션 - 커넥션 풀을 재사용하여 호출마다 TCP/TLS 핸드셰이크를 반복하지 않는다
+# (여러 사용자가 공유하므로 쿠키는 저장하지 않음)
+_SESSION = requests.Session()
+_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
 
 @st.cache_data(ttl=600) # 10분 동안 API 응답을 캐싱하여 불필요한 호출 방지
 def get_available_models() -> List[str]:
@@ -42,7 +52,7 @@ def get_available_models() -> List[str]:
         List[str]: 모델 이름 목록. 오류 발생 시 ["목록을 불러오지 못했습니다"] 반환.
     """
     try:
-        response = requests.get(ChatAPIKeys.MODEL_LIST, timeout=5)
+        response = _SESSION.get(ChatAPIKeys.MODEL_LIST, timeout=5)
         response.raise_for_status()     # 200 OK가 아니면 예외 발생
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -66,7 +76,7 @@ def get_default_model() -> str:
         str: 기본 모델명. 오류 발생 시 "" 반환.
     """
     try:
-        response = requests.get(ChatAPIKeys.DEFAULT_MODEL, timeout=5)
+        response = _SESSION.get(ChatAPIKeys.DEFAULT_MODEL, timeout=5)
         response.raise_for_status()     # 200 OK가 아니면 예외 발생
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -91,7 +101,7 @@ def stop_streaming(request_id: str):
     """
     try:
         # 백엔드에 자연어 생성 중단 신호 전송
-        requests.post(
+        _SESSION.post(
             ChatAPIKeys.STOP_STREAMING,
             json={"request_id": request_id},
             timeout=5
@@ -156,7 +166,7 @@ class ChatStyle:
             endpoint (str): 백엔드 API 주소
             payload (dict): 요청 데이터
         """
-        with requests.post(
+        with _SESSION.post(
             endpoint,
             json=payload,
             stream=True,
@@ -205,9 +215,8 @@ class ChatStyle:
                         # [Case B] 일반 스트리밍 텍스트(str)인 경우
                         txt = contents
 
-                    # 4. 결과 누적 및 UI 전파
+                    # 4. 결과 UI 전파
+                    # (전체 응답 누적은 호출부 Response의 StringIO 버퍼가 담당 - Rerun 시 UI 복원용)
                     if txt:
-                        # 전체 응답 내용을 세션 상태에 누적 기록 (Rerun 시 UI 복원용)
-                        st.session_state[SessionKey.TEMP_RESPONSE] += txt
                         # 현재 텍스트 조각을 즉시 UI로 전달 (타이핑 효과)
                         yield txt
@@ -1,6 +1,9 @@
+from collections import deque
+
 from app.constants.keys import (
     SessionKey, LoginViews, PageNum, PageKey, ToolsViews
 )
+from app.constants.values import FixValues
 
 
 DEFAULT_SESSION = {
@@ -16,10 +19,10 @@ DEFAULT_SESSION = {
     SessionKey.IS_ADMIN: None,
 
     # 채팅 및 스트리밍 상태
-    SessionKey.MESSAGE: [],
+    SessionKey.MESSAGE: deque(maxlen=FixValues.CHAT_HISTORY_MAX),   # 최근 N개만 보관
     SessionKey.STREAMING: False,
     SessionKey.STOP_STREAM: False,
-    SessionKey.TEMP_RESPONSE: "",
+    SessionKey.TEMP_RESPONSE: None,
 
     # View 초기화
     LoginViews.KEY: LoginViews.LOGIN_BEFORE,    # Login 화면
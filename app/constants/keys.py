@@ -46,7 +46,7 @@ class SessionKey:
     MESSAGE: Final[str] = "message"                     # 채팅 대화 기록
     STREAMING: Final[str] = "streaming"                 # 현재 LLM 응답 스트리밍 여부
     STOP_STREAM: Final[str] = "stop_stream"             # LLM 응답 스트리밍 정지 여부
-    TEMP_RESPONSE: Final[str] = "temp_response"         # 응답 중단 시 복구용 임시 저장소
+    TEMP_RESPONSE: Final[str] = "temp_response"         # 응답 중단 시 복구용 임시 버퍼 (io.StringIO, 스트리밍 중이 아니면 None)
     CHAT_REQUEST_ID: Final[str] = "chat_request_id"     # 채팅 건에 대한 request_id 
 
     # --- 모델 관련 ---
@@ -204,6 +204,9 @@ class SignupKey:
     KTR_ID_MSG: Final[str] = "signup_ktr_id_message"        # ktr_id 결과 메시지
     EMAIL_MSG: Final[str] = "signup_email_message"          # email 결과 메시지
 
+    # --- 일괄 중복검사 결과 캐시 ((user_id, ktr_id, email), 결과 dict) ---
+    BATCH: Final[str] = "signup_unique_keys_batch"
+
 
 
 # ============================================================
@@ -232,6 +235,9 @@ class AdminViews:
     TABLE_BLOCK: Final[str] = "t_block"
     TABLE_CLAER: Final[str] = "t_clear"
 
+    # 뷰별 필터 마스크(bool ndarray) 세션 키 - TABLE_ALL 외 뷰는 마스크만 저장
+    MASK_KEY: Final[str] = "{table}_mask"
+
 
 class AdminUserModify:
     INDEX_LIST: Final[str] = "admin_selected_idxes"         # Admin Table에서 선택된 index를 담는 list
@@ -239,6 +245,7 @@ class AdminUserModify:
     BLOCK_IDX_LIST: Final[str] = "admin_block_idxes"        # Admin Table에서 Block(Soft-delete)인 유저들의 index를 담는 list
 
     DELETE_WAIT: Final[str] = "admin_delete_wait"           # Admin Table에서 dialog에서 중복 입력 방어
+    TABLE_VERSION: Final[str] = "admin_table_version"       # Admin Table 전처리 캐시 무효화용 버전(조작 시 증가)
 
 
 
@@ -31,6 +31,11 @@ class FixValues:
     """
     app/api/p2_chat.py - streaming_response의 출력에서, API의 대기 시간
     """
+    # 채팅 기록 최대 보관 수
+    CHAT_HISTORY_MAX: Final[int] = 200
+    """
+    세션의 채팅 기록(SessionKey.MESSAGE, deque)에 보관하는 최대 메시지 수 - 초과 시 오래된 메시지부터 제거
+    """
     # Flash life
     FLASH_LIFE: Final[int] = 2
     """
@@ -6,10 +6,11 @@
 - SoftDelete : 본인 계정 사용 정지(Soft-delete) 확인/실행
 
 UI는 Streamlit `st.form` 기반으로, 폼 내에서 입력과 버튼을 렌더링하고
-폼 블록 **밖**에서 이벤트를 처리하여 사이드이펙트(페이지 이동, 세션 변경 등)를 수행한다.
+화면 전환은 버튼 on_click 콜백으로 처리한다(콜백 후 자동 재실행).
+제출(정보 수정/계정 정지)은 결과 메시지가 폼 아래에 표시되도록 폼 블록 **밖** 본문에서 처리한다.
+단, 이메일 입력 + '중복 확인' 버튼은 폼 밖 `st.fragment`로 분리하여 해당 블록만 재실행한다.
 """
 import streamlit as st
-from typing import Tuple
 
 from app.constants.values import Ratio
 from app.constants.pathes import PagePath
@@ -17,7 +18,7 @@ from app.constants.keys import SessionKey, LoginViews, SignupKey
 from app.constants.messages import SOFT_DELETE
 from app.utils.session import SessControl
 from app.utils.p1_login import (
-    view_changer, input_cleaner, SignUpUniqueKeys,
+    view_changer, SignUpUniqueKeys,
     SoftDeleteAction, EditAction
 )
 
@@ -60,18 +61,18 @@ class AfterLogin:
                 """
             )
             # 동작 버튼(챗봇, 로그아웃, 회원정보 수정)
-            chat_btn, logout_btn, edit_btn = cls._btns()
+            chat_btn = cls._btns()
 
         # ===== 폼 블록 밖에서 이벤트 처리 =====
+        # 페이지 이동은 콜백 내에서 불가하므로 본문에서 처리
         if chat_btn:
             st.switch_page(PagePath.P2_CHAT)
 
-        if logout_btn:
-            # 세션 초기화 후 로그인 전 화면으로
-            SessControl.init(force=True)
-            view_changer(LoginViews.LOGIN_BEFORE)
-
-        if edit_btn: view_changer(LoginViews.EDIT)
+    @classmethod
+    def _logout(cls):
+        """'로그아웃' 버튼 on_click 콜백: 세션 초기화 후 로그인 전 화면으로."""
+        SessControl.init(force=True)
+        view_changer(LoginViews.LOGIN_BEFORE)
 
     @classmethod
     def _role_handler(cls) -> str:
@@ -87,12 +88,13 @@ class AfterLogin:
         return "사용자"
 
     @classmethod
-    def _btns(cls) -> Tuple[bool, bool, bool]:
+    def _btns(cls) -> bool:
         """
         하단 버튼 3종(챗봇/로그아웃/회원정보 수정) 렌더링.
+        - 로그아웃/회원정보 수정은 on_click 콜백으로 처리
         Returns
         -------
-        tuple[bool, bool, bool] : (chat_btn, logout_btn, edit_btn) 클릭 여부
+        bool : chat_btn 클릭 여부
         """
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -102,16 +104,19 @@ class AfterLogin:
                 use_container_width=True
             )
         with col2:
-            logout_btn = st.form_submit_button(
+            st.form_submit_button(
                 "로그아웃", 
-                use_container_width=True
+                use_container_width=True,
+                on_click=cls._logout
             )
         with col3:
-            edit_btn = st.form_submit_button(
+            st.form_submit_button(
                 "회원 정보 수정", 
-                use_container_width=True
+                use_container_width=True,
+                on_click=view_changer,
+                args=(LoginViews.EDIT,)
             )
-        return chat_btn, logout_btn, edit_btn
+        return chat_btn
 
 
 
@@ -130,7 +135,7 @@ class Edit:
     def UI(cls):
         """
         Edit 메인 뷰 렌더링 + 이벤트 처리.
-        - 이메일 중복 확인은 별도의 버튼(폼 내 submit 버튼)으로 처리
+        - 이메일 중복 확인은 폼 밖 fragment의 버튼(on_click 콜백)으로 처리
         - 회원 정보 수정은 현재 비밀번호 필수
         """
         st.subheader("회원 정보 수정")
@@ -138,43 +143,49 @@ class Edit:
         # 이메일 중복확인 UI 상태를 위한 세션키 초기화
         SignUpUniqueKeys.keys_rock()
 
+        # ========== 필드 ==========
+        # 1) 수정 불가(ID, 사번) - 현상태를 보여주기만 하는 용도
+        cls._no_modify_set()
+
+        # 2) 중복 확인이 필요한 필드(이메일) - fragment: 중복확인 시 이 블록만 재실행
+        cls._hard_modify_set()
+
         with st.form("edit_form", clear_on_submit=False):
 
-            # ========== 필드 ==========
-            # 0) 현재 비밀번호 - 계정 정보 변경을 위한 필수 입력 값
-            pwd_current = st.text_input(
+            # 3) 현재 비밀번호 - 계정 정보 변경을 위한 필수 입력 값 (폼 내부: 입력 시 rerun 없음)
+            st.text_input(
                 "현재 비밀번호", 
                 key="edit_pwd_old", 
                 type="password",
                 placeholder="계정 정보 변경을 위한 필수 입력 값"
             )
-            # 1) 수정 불가(ID, 사번) - 현상태를 보여주기만 하는 용도
-            cls._no_modify_set()
-            # 2) 중복 확인이 필요한 필드(이메일)
-            email, email_checker = cls._hard_modify_set()
-            # 3) 비교적 자유롭게 수정 가능한 필드(비번/이름/개발자)
-            pwd_new_raw, pwd_new_check, user_name, is_developer\
-                = cls._easy_modify_set()
-            submit, go_back, soft_delete = cls._action_btn_set()
+            # 4) 비교적 자유롭게 수정 가능한 필드(비번/이름/개발자)
+            cls._easy_modify_set()
+            # 이동 버튼은 on_click 콜백으로 처리, 제출 여부만 반환
+            submit = cls._action_btn_set()
 
         # ========== 이벤트 처리 ==========
-        # 이메일 중복 확인
-        if email_checker: SignUpUniqueKeys.checker_action(email=email)
-
-        # 회원 정보 수정
-        if submit: EditAction.run(
-            pwd_current=input_cleaner(pwd_current),
-            user_name=input_cleaner(user_name),
-            developer=input_cleaner(is_developer, is_boolean=True),
-            email=input_cleaner(email),
-            pwd_new_raw=input_cleaner(pwd_new_raw),
-            pwd_new_check=input_cleaner(pwd_new_check),
-        )
-        # 뒤로 가기
-        if go_back: view_changer(LoginViews.LOGIN_AFTER)
+        # 회원 정보 수정 - 메시지가 폼 아래에 출력되도록 본문에서 처리
+        if submit: cls._submit()
 
-        # 계정 사용 정지 화면으로 이동
-        if soft_delete: view_changer(LoginViews.SOFT_DELETE)
+    @classmethod
+    def _submit(cls):
+        """
+        회원 정보 수정 제출 처리.
+
+        - 입력값을 위젯 세션 키에서 읽어 EditAction.run()에 전달
+          (이메일은 폼 밖 fragment의 위젯 값이므로 세션에서 읽는다)
+        - 입력값 정리(input_cleaner)는 EditAction.run() 진입점에서 수행
+        """
+        ss = st.session_state
+        EditAction.run(
+            pwd_current=ss.get("edit_pwd_old", ""),
+            user_name=ss.get("edit_user_name", ""),
+            developer=ss.get("edit_is_developer", False),
+            email=ss.get("edit_email", ""),
+            pwd_new_raw=ss.get("edit_pwd_raw", ""),
+            pwd_new_check=ss.get("edit_pwd_check", ""),
+        )
 
     @classmethod
     def _no_modify_set(cls):
@@ -197,13 +208,12 @@ class Edit:
         )
 
     @classmethod
-    def _hard_modify_set(cls) -> Tuple[str, bool]:
+    @st.fragment
+    def _hard_modify_set(cls):
         """
         중복 확인이 필요한 필드 렌더링(이메일).
         - SignUpUniqueKeys.set_condition()으로 버튼 색/메시지 상태 결정
-        Returns
-        -------
-        tuple[str, bool] : (입력 이메일, '중복 확인' 버튼 클릭 여부)
+        - st.fragment로 감싸 '중복 확인' 클릭 시 이 블록만 재실행
         """
         # 세션에 저장된 값에 따라 변경되는 내용
         btn_type, msg = SignUpUniqueKeys.set_condition(
@@ -211,7 +221,7 @@ class Edit:
         )
         c1, c2 = st.columns(Ratio.LOGIN_BAR_N_BTN)
         with c1:
-            email = st.text_input(
+            st.text_input(
                 "E-mail", 
                 key="edit_email",
                 placeholder=st.session_state[SessionKey.EMAIL]
@@ -222,79 +232,83 @@ class Edit:
                 "<div style='height: 1.7rem;'></div>", 
                 unsafe_allow_html=True
             )
-            email_checker = st.form_submit_button(
+            st.button(
                 "E-mail 중복 확인",
                 use_container_width=True,
-                type=btn_type
+                type=btn_type,
+                on_click=SignUpUniqueKeys.checker_callback,
+                args=("email", "edit_email")
             )
 
         # 중복확인 결과 메시지
         SignUpUniqueKeys.set_show_msg(bool_key=SignupKey.EMAIL, message=msg)
 
-        return email, email_checker
-
     @classmethod
-    def _easy_modify_set(cls) -> Tuple[str, str, str, bool]:
+    def _easy_modify_set(cls) -> None:
         """
         자유 변경 가능 필드 렌더링(새 비밀번호/확인, 사용자 이름, 개발자 전환).
-        Returns
-        -------
-        tuple[str, str, str, bool]
+        - 반환값 없음: 입력값은 위젯 세션 키(edit_pwd_raw, edit_pwd_check,
+          edit_user_name, edit_is_developer)에 저장되며 _submit()이 세션에서 읽는다.
         """
         # [사용자 비밀번호 - 신규 raw]
-        pwd_new_raw = st.text_input(
+        st.text_input(
             "신규 비밀번호", 
             key="edit_pwd_raw", 
             type="password",
             placeholder="영문/숫자/특수문자(공백 제외)만 허용 (12~64자)"
         )
         # [사용자 비밀번호 - 신규 raw check]
-        pwd_new_check = st.text_input(
+        st.text_input(
             "신규 비밀번호 확인", 
             key="edit_pwd_check", 
             type="password"
         )
         # [사용자 이름]
-        user_name = st.text_input(
+        st.text_input(
             "사용자 이름 (별명)", 
             key="edit_user_name",
             placeholder="한글/영문/특수문자(-_) (2~20자)"
         )
         # [개발자 여부]
-        is_developer = st.checkbox(
+        st.checkbox(
             "개발자 계정 전환 (관리자 승인이 떨어질 때까지 사용 불가합니다.)", 
             key="edit_is_developer", 
         )
-        return (
-            pwd_new_raw, pwd_new_check, user_name, is_developer
-        )
     
     @classmethod
-    def _action_btn_set(cls) -> Tuple[bool, bool, bool]:
+    def _action_btn_set(cls) -> bool:
         """
         하단 액션 버튼 3종(수정/뒤로/계정 정지) 렌더링.
+        - 뒤로/계정 정지 버튼은 on_click 콜백으로 동작한다.
         Returns
         -------
-        tuple[bool, bool, bool] : (submit, go_back, soft_delete)
+        bool : submit 클릭 여부
         """
         col1, col2, col3 = st.columns(3)
         with col1:
+            # 회원 정보 수정
             submit = st.form_submit_button(
                 "회원 정보 수정", 
                 type="primary", 
                 use_container_width=True
             )
         with col2:
-            go_back = st.form_submit_button(
+            # 뒤로 가기
+            st.form_submit_button(
                 "뒤로 가기", 
-                use_container_width=True
+                use_container_width=True,
+                on_click=view_changer,
+                args=(LoginViews.LOGIN_AFTER,)
             )
         with col3:
-            soft_delete = st.form_submit_button(
+            # 계정 사용 정지 화면으로 이동
+            st.form_submit_button(
                 "계정 사용 정지", 
-                use_container_width=True
+                use_container_width=True,
+                on_click=view_changer,
+                args=(LoginViews.SOFT_DELETE,)
             )
-        return submit, go_back, soft_delete
+        return submit
     
 
 
@@ -327,30 +341,29 @@ class SoftDelete:
                 type="password",
                 placeholder="비밀번호를 입력하십시오 (12~64자)"
             )
-            # 액션 버튼
-            back_btn, block_btn = cls._btns()
+            # 액션 버튼 (뒤로가기는 on_click 콜백으로 처리)
+            block_btn = cls._btns()
 
         # ========== 이벤트 처리 ==========
-        # 뒤로가기
-        if back_btn: view_changer(LoginViews.EDIT)
-
         # 계정 정지 버튼
         if block_btn: SoftDeleteAction.run(password=_pwd)
 
     @classmethod
-    def _btns(cls) -> Tuple[bool, bool]:
+    def _btns(cls) -> bool:
         """
         뒤로가기 / 계정 정지 버튼 렌더링.
         Returns
         -------
-        tuple[bool, bool] : (back_btn, block_btn)
+        bool : block_btn 클릭 여부
         """
         # 계정 정지, 뒤로가기 버튼
         col1, col2 = st.columns(2)
         with col1:
-            back_btn = st.form_submit_button(
+            st.form_submit_button(
                 "뒤로가기", 
-                use_container_width=True
+                use_container_width=True,
+                on_click=view_changer,
+                args=(LoginViews.EDIT,)
             )
         with col2:
             block_btn = st.form_submit_button(
@@ -358,5 +371,5 @@ class SoftDelete:
                 use_container_width=True, 
                 type="primary"
             )
-        return back_btn, block_btn
+        return block_btn
 
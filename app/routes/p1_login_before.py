@@ -7,14 +7,19 @@
 
 구현 메모
 ---------
-- 모든 화면은 Streamlit `st.form` 기반으로, 폼 내부에서 입력/버튼을 렌더링하고
-  폼 블록 "밖"에서 클릭 이벤트를 분기 처리한다(rerun/화면전환 안정성).
+- 모든 화면은 Streamlit `st.form` 기반으로, 폼 내부에서 입력/버튼을 렌더링한다.
+- 화면 전환 버튼은 on_click 콜백으로 처리하여 클릭당 스크립트 실행을 1회로 유지한다
+  (콜백 후 자동 재실행 → 별도의 st.rerun() 불필요).
+- 제출(로그인/회원가입)은 폼 블록 "밖" 본문에서 처리하여 결과 메시지가 폼 아래에 표시되도록 한다.
 - 회원가입 필드의 '중복 확인' 버튼은 세션키(SignupKey.*)를 이용해
   버튼 색(검증 통과: primary / 미통과: secondary)과 메시지를 동기화한다.
+- 유니크 키(계정/사번/이메일) 입력과 '중복 확인' 버튼은 폼 밖의 `st.fragment`로 분리하여,
+  버튼 클릭 시 페이지 전체가 아닌 해당 블록만 재실행되도록 한다(on_click 콜백).
 """
 from typing import Optional, Tuple
 
 import streamlit as st
+from pydantic import ValidationError
 
 from app.api.p1_login import verify_login
 from app.constants.values import Ratio
@@ -46,7 +51,7 @@ class BeforeLogin:
         --------
         1) 로그인 폼에 ID, Password 입력
         2) '로그인' 버튼 클릭 → _login_action() 실행
-        3) '회원가입' 버튼 클릭 → view_changer(LoginViews.SIGN_UP) 호출
+        3) '회원가입'/'비밀번호 분실' 버튼 클릭 → on_click=view_changer로 화면 전환
         """
 
         st.title("Login")
@@ -55,28 +60,23 @@ class BeforeLogin:
         with st.form("login_form"):
 
             # ID/Password 입력 + 버튼 렌더링
-            _id, _pwd, login_btn, signup_btn, lost_pwd_btn = cls._id_pwd_set()
+            # - 회원가입/비밀번호 분실 버튼은 on_click 콜백으로 화면 전환
+            _id, _pwd, login_btn = cls._id_pwd_set()
 
         # ========== 이벤트 처리 ==========
         # 로그인 버튼 → 로그인 프로세스 실행
         if login_btn: cls._login_action(user_id=_id, pwd=_pwd)
-            
-        # 회원가입 버튼 → 회원가입 화면으로 이동
-        if signup_btn: view_changer(LoginViews.SIGN_UP)
-
-        # 비밀번호 분실 → 관리자 연락처 제공
-        if lost_pwd_btn: view_changer(LoginViews.LOST_PASSWORD)
 
     @classmethod
     def _id_pwd_set(
             cls
-        ) -> Tuple[str, str, bool, bool]:
+        ) -> Tuple[str, str, bool]:
         """
         로그인 입력 필드와 버튼 UI를 렌더링하고 현재 입력/클릭 상태를 반환.
 
         Returns
         -------
-        (user_id, password, login_clicked, signup_clicked)
+        (user_id, password, login_clicked)
         """
         # id, password 바
         _id = st.text_input("ID")
@@ -91,17 +91,23 @@ class BeforeLogin:
                 type="primary"
             )
         with col2:
-            signup_btn = st.form_submit_button(
+            # 회원가입 → 회원가입 화면으로 이동
+            st.form_submit_button(
                 "회원가입", 
-                use_container_width=True
+                use_container_width=True,
+                on_click=view_changer,
+                args=(LoginViews.SIGN_UP,)
             )
         with col3:
-            lost_pwd_btn = st.form_submit_button(
+            # 비밀번호 분실 → 관리자 연락처 제공
+            st.form_submit_button(
                 "비밀번호 분실", 
-                use_container_width=True
+                use_container_width=True,
+                on_click=view_changer,
+                args=(LoginViews.LOST_PASSWORD,)
             )
         
-        return _id, _pwd, login_btn, signup_btn, lost_pwd_btn
+        return _id, _pwd, login_btn
 
     @classmethod
     def _login_action(cls, user_id: str, pwd: str):
@@ -142,8 +148,9 @@ class BeforeLogin:
             st.session_state[SessionKey.USER_NAME] = values[UserInfo.USER_NAME]
             st.session_state[SessionKey.KTR_ID] = values[UserInfo.KTR_ID]
             st.session_state[SessionKey.EMAIL] = values[UserInfo.EMAIL]
-            # View 변경
+            # View 변경 (콜백이 아닌 본문 실행이므로 직접 rerun)
             view_changer(LoginViews.LOGIN_AFTER)
+            st.rerun()
         else:
             st.error(msg)
 
@@ -175,7 +182,7 @@ class BeforeLogin:
         # 2) 제약 조건 검증 (길이, 패턴 등)
         try:
             UserLogin(user_id=user_id, password=password)
-        except:
+        except ValidationError:
             return LoginMsg.ID_AND_PWD_WRONG
         
         return None    
@@ -196,55 +203,67 @@ class SignUp:
         """
         회원가입 화면 렌더링 + 이벤트 처리.
         - 중복 키 세션 초기화(SignUpUniqueKeys.keys_rock)
-        - 각 필드/버튼 렌더링
-        - 폼 밖에서 이벤트 분기(중복확인/제출/이동)
+        - 유니크 키 필드/중복확인 버튼 렌더링(fragment)
+        - 나머지 필드/버튼은 폼으로 렌더링하고, 화면 이동은 on_click 콜백으로 처리
+        - 제출은 폼 밖 본문에서 처리하여 결과 메시지가 폼 아래에 표시되도록 한다
         """
         st.subheader("신규 계정 생성")
 
         # 중복 키 검증 상태 세션 초기화(버튼 색/메시지 구동용)
         SignUpUniqueKeys.keys_rock()
 
+        # ========== 유니크 키 필드 (fragment: 중복확인 시 이 블록만 재실행) ==========
+        cls._unique_key_block()
+
         with st.form("signup_form", clear_on_submit=False):
 
             # ========== 필드 ==========
-            user_id, user_id_checker= cls._user_id_set()
-            ktr_id, ktr_id_checker = cls._ktr_id_set()
-            email, email_checker = cls._email_set()
-            pwd_raw, pwd_check, user_name, is_developer = cls._details_set()
-            p_info_agree = cls._personal_info_agree_set()
-            submit, show_p_info_agree, go_back = cls._action_btn_set()
+            cls._details_set()
+            cls._personal_info_agree_set()
+            # 이동 버튼은 on_click 콜백으로 처리, 제출 여부만 반환
+            submit = cls._action_btn_set()
 
         # ========== 이벤트 처리 ==========
-        # 개인정보 수집 안내로 이동
-        if show_p_info_agree: view_changer(LoginViews.PERSONAL_INFO_AGREE)
-            
-        # 로그인 화면으로 이동
-        if go_back: view_changer(LoginViews.LOGIN_BEFORE)
-
-        # 계정 중복 확인 버튼
-        if user_id_checker: SignUpUniqueKeys.checker_action(user_id=user_id)
-        
-        # 사번 중복 확인 버튼
-        if ktr_id_checker: SignUpUniqueKeys.checker_action(ktr_id=ktr_id)
-
-        # 이메일 중복 확인 버튼
-        if email_checker: SignUpUniqueKeys.checker_action(email=email)
-
-        # 회원가입 제출(최종 검토 → BE 호출)
-        if submit: SignUpAction.run(
-            user_id=user_id,
-            ktr_id=ktr_id,
-            email=email,
-            pwd_raw=pwd_raw,
-            pwd_check=pwd_check,
-            user_name=user_name,
-            is_developer=is_developer,
-            p_info_agree=p_info_agree
+        # 회원가입 제출(최종 검토 → BE 호출) - 메시지가 폼 아래에 출력되도록 본문에서 처리
+        if submit: cls._submit()
+
+    @classmethod
+    def _submit(cls):
+        """
+        회원가입 제출 처리 (최종 검토 → BE 호출).
+
+        - 입력값을 위젯 세션 키에서 읽어 SignUpAction.run()에 전달
+          (유니크 키는 폼 밖 fragment의 위젯 값이므로 세션에서 읽는다)
+        """
+        ss = st.session_state
+        SignUpAction.run(
+            user_id=ss.get("signup_user_id", ""),
+            ktr_id=ss.get("signup_ktr_id", ""),
+            email=ss.get("signup_email", ""),
+            pwd_raw=ss.get("signup_pwd_raw", ""),
+            pwd_check=ss.get("signup_pwd_check", ""),
+            user_name=ss.get("signup_user_name", ""),
+            is_developer=ss.get("signup_is_developer", False),
+            p_info_agree=ss.get("signup_personal_info_agree", False)
         )
 
+    @classmethod
+    @st.fragment
+    def _unique_key_block(cls):
+        """
+        유니크 키(user_id/ktr_id/email) 입력 + '중복 확인' 버튼 블록.
+
+        - st.fragment로 감싸 '중복 확인' 클릭 시 이 블록만 재실행한다.
+        - 버튼은 on_click 콜백(SignUpUniqueKeys.checker_callback)으로 검사를 수행하므로
+          콜백 직후의 fragment 재실행에서 버튼 색/메시지가 곧바로 갱신된다.
+        """
+        cls._user_id_set()
+        cls._ktr_id_set()
+        cls._email_set()
+
     # user_id 버튼 셋
     @classmethod
-    def _user_id_set(cls) -> Tuple[str, bool]:
+    def _user_id_set(cls):
         """
         신규 계정(user_id) 입력 + '계정 중복 확인' 버튼 렌더링.
 
@@ -253,9 +272,6 @@ class SignUp:
         - SignUpUniqueKeys.set_condition() 결과에 따라 primary/secondary 지정
         - SignUpUniqueKeys.set_show_msg()로 중복 결과 메시지 출력
 
-        Returns
-        -------
-        tuple[str, bool] : (입력한 user_id, '중복 확인' 클릭 여부)
         """
         # 세션에 저장된 값에 따라 변경되는 내용
         btn_type, msg = SignUpUniqueKeys.set_condition(
@@ -264,7 +280,7 @@ class SignUp:
         # 버튼 렌더링
         c1, c2 = st.columns(Ratio.LOGIN_BAR_N_BTN)
         with c1:
-            user_id = st.text_input(
+            st.text_input(
                 "신규 계정",
                 key="signup_user_id",
                 placeholder=LoginSignupMsg.USER_ID_PAT
@@ -276,24 +292,20 @@ class SignUp:
                 unsafe_allow_html=True
             )
             # 버튼
-            user_id_checker = st.form_submit_button(
+            st.button(
                 "계정 중복 확인",
                 use_container_width=True,
-                type=btn_type
+                type=btn_type,
+                on_click=SignUpUniqueKeys.checker_callback,
+                args=("user_id", "signup_user_id")
             )
         # 메시지 출력
         SignUpUniqueKeys.set_show_msg(bool_key=SignupKey.USER_ID, message=msg)
 
-        return user_id, user_id_checker
-
     @classmethod
-    def _ktr_id_set(cls) -> Tuple[str, bool]:
+    def _ktr_id_set(cls):
         """
         사번(ktr_id) 입력 + '사번 중복 확인' 버튼 렌더링.
-
-        Returns
-        -------
-        tuple[str, bool] : (입력한 ktr_id, '중복 확인' 클릭 여부)
         """
         # 세션에 저장된 값에 따라 변경되는 내용
         btn_type, msg = SignUpUniqueKeys.set_condition(
@@ -303,7 +315,7 @@ class SignUp:
         # 버튼 렌더링
         c1, c2 = st.columns(Ratio.LOGIN_BAR_N_BTN)
         with c1:
-            ktr_id = st.text_input(
+            st.text_input(
                 "사번",
                 key="signup_ktr_id",
                 placeholder="사번 1개당 1개의 아이디만 생성 가능"
@@ -315,10 +327,12 @@ class SignUp:
                 unsafe_allow_html=True
             )
             # 버튼
-            ktr_id_checker = st.form_submit_button(
+            st.button(
                 "사번 중복 확인",
                 use_container_width=True,
-                type=btn_type
+                type=btn_type,
+                on_click=SignUpUniqueKeys.checker_callback,
+                args=("ktr_id", "signup_ktr_id")
             )
 
         # 메시지 출력
@@ -327,16 +341,10 @@ class SignUp:
             message=msg
         )
 
-        return ktr_id, ktr_id_checker
-
     @classmethod
-    def _email_set(cls) -> Tuple[str, bool]:
+    def _email_set(cls):
         """
         이메일(email) 입력 + 'E-mail 중복 확인' 버튼 렌더링.
-
-        Returns
-        -------
-        tuple[str, bool] : (입력한 email, '중복 확인' 클릭 여부)
         """
         # 세션에 저장된 값에 따라 변경되는 내용
         btn_type, msg = SignUpUniqueKeys.set_condition(
@@ -345,7 +353,7 @@ class SignUp:
         # 버튼 렌더링
         c1, c2 = st.columns(Ratio.LOGIN_BAR_N_BTN)
         with c1:
-            email = st.text_input(
+            st.text_input(
                 "E-mail",
                 key="signup_email",
                 placeholder="E-mail 1개당 1개의 아이디만 생성 가능"
@@ -356,10 +364,12 @@ class SignUp:
                 "<div style='height: 1.7rem;'></div>", 
                 unsafe_allow_html=True
             )
-            email_checker = st.form_submit_button(
+            st.button(
                 "E-mail 중복 확인",
                 use_container_width=True,
-                type=btn_type
+                type=btn_type,
+                on_click=SignUpUniqueKeys.checker_callback,
+                args=("email", "signup_email")
             )
 
         # 메시지 출력
@@ -367,46 +377,39 @@ class SignUp:
             bool_key=SignupKey.EMAIL, 
             message=msg
         )
-
-        return email, email_checker
     
     @classmethod
-    def _details_set(cls) -> Tuple[str, str, str, bool]:
+    def _details_set(cls) -> None:
         """
-        기타 상세 정보 입력(비밀번호/비밀번호 확인/사용자 이름/개발자 여부).
+        기타 상세 정보 입력(비밀번호/비밀번호 확인/사용자 이름/개발자 여부) 렌더링.
 
-        Returns
-        -------
-        tuple[str, str, str, bool]
-            (pwd_raw, pwd_check, user_name, is_developer)
+        - 반환값 없음: 입력값은 위젯 세션 키(signup_pwd_raw, signup_pwd_check,
+          signup_user_name, signup_is_developer)에 저장되며 _submit()이 세션에서 읽는다.
         """
         # [사용자 비밀번호 - raw]
-        pwd_raw = st.text_input(
+        st.text_input(
             "비밀번호", 
             key="signup_pwd_raw", 
             type="password",
             placeholder=LoginSignupMsg.PWD_PAT
         )
         # [사용자 비밀번호 - raw check]
-        pwd_check = st.text_input(
+        st.text_input(
             "비밀번호 확인", 
             key="signup_pwd_check", 
             type="password"
         )
         # [사용자 이름]
-        user_name = st.text_input(
+        st.text_input(
             "사용자 이름 (별명)", 
             key="signup_user_name",
             placeholder=LoginSignupMsg.USER_NAME_PAT
         )
         # [개발자 여부]
-        is_developer = st.checkbox(
+        st.checkbox(
             "개발자 계정 (개발자 계정은 관리자 승인이 필요합니다!)", 
             key="signup_is_developer", 
         )
-        return (
-            pwd_raw, pwd_check, user_name, is_developer
-        )
     
     @classmethod
     def _personal_info_agree_set(cls) -> bool:
@@ -426,30 +429,37 @@ class SignUp:
         return p_info_agree
     
     @classmethod
-    def _action_btn_set(cls) -> Tuple[bool, bool, bool]:
+    def _action_btn_set(cls) -> bool:
         """
         하단 액션 버튼(회원가입, 개인정보 수집 안내 보기, 로그인 화면 이동) 렌더링.
 
+        - 화면 이동 버튼은 on_click 콜백으로 동작한다.
+
         Returns
         -------
-        tuple[bool, bool, bool]
-            (submit_clicked, show_p_info_clicked, go_back_clicked)
+        bool
+            submit_clicked
         """
         col1, col2, col3 = st.columns(3)
         with col1:
+            # 회원가입 제출(최종 검토 → BE 호출)
             submit = st.form_submit_button(
                 "회원가입", type="primary", use_container_width=True
             )
         with col2:
-            show_p_info_agree = st.form_submit_button(
-                "개인정보 수집 내용 확인", use_container_width=True
+            # 개인정보 수집 안내로 이동
+            st.form_submit_button(
+                "개인정보 수집 내용 확인", use_container_width=True,
+                on_click=view_changer, args=(LoginViews.PERSONAL_INFO_AGREE,)
             )
 
         with col3:
-            go_back = st.form_submit_button(
-                "로그인 화면 이동", use_container_width=True
+            # 로그인 화면으로 이동
+            st.form_submit_button(
+                "로그인 화면 이동", use_container_width=True,
+                on_click=view_changer, args=(LoginViews.LOGIN_BEFORE,)
             )
-        return submit, show_p_info_agree, go_back
+        return submit
     
 
 
@@ -471,17 +481,17 @@ class ShowPersonalInfoAgree:
 
             st.markdown(PERSONAL_INFO_AGREE)
 
-            back_btn = st.form_submit_button(
+            st.form_submit_button(
                 "회원가입 화면으로 돌아가기", 
                 type="primary", 
-                use_container_width=True
+                use_container_width=True,
+                on_click=view_changer,
+                args=(LoginViews.SIGN_UP,)
             )
 
         # 중복검사 세션 상태 초기화(버튼 색/메시지 일관성 유지)
         SignUpUniqueKeys.keys_rock_init()
 
-        if back_btn: view_changer(LoginViews.SIGN_UP)
-
 
 
 class LostPassword:
@@ -503,9 +513,10 @@ class LostPassword:
 
     @classmethod
     def go_to_back(cls):
-        if st.button(
+        st.button(
             "뒤로 가기",
             use_container_width=True,
-            type="primary"
-        ):
-            view_changer(view_name=LoginViews.LOGIN_BEFORE)
\ No newline at end of file
+            type="primary",
+            on_click=view_changer,
+            args=(LoginViews.LOGIN_BEFORE,)
+        )
\ No newline at end of file
@@ -151,6 +151,6 @@ class SideBar:
             # 현재 대화가 생성중이면 채팅 입력이 되지 않는다
             disabled=st.session_state[SessionKey.STREAMING]
         ):
-            st.session_state[SessionKey.MESSAGE] = []
+            st.session_state[SessionKey.MESSAGE].clear()
             st.rerun()
 
@@ -106,6 +106,7 @@ class SideBar:
         # 전체 DB 조회: 데이터 소량 가정 → 전체 pull 후 FE에서 필터링
         if f_search:
             # 데이터의 양이 적어 전체 DB를 조회하는 형태로 하며, 이때 미리 생성
+            # (조작 후에는 세션 DF만 증분 갱신되므로, DB와 강제 동기화가 필요할 때도 이 버튼 사용)
             GetTable.base()                    # ALL/SIGNUP/BLOCK/DEVELOPER DF 준비
             view_changer(AdminViews.ALL)       # ALL 뷰로 전환
         if f_all:
@@ -6,6 +6,7 @@
 - FE와 BE 간의 유저 정보·로그인·중복검사 등의 데이터 형식을 완전히 일치시키기 위함.
 - Annotated + StringConstraints를 활용하여 각 필드의 길이, 정규식, 공백 처리 규칙을 명확히 고정.
 """
+import re
 from typing import Annotated, Optional
 from pydantic import EmailStr, StringConstraints, BaseModel
 
@@ -34,6 +35,9 @@ Password = Annotated[str, StringConstraints(
     max_length=64,
     pattern=r'^[A-Za-z0-9!"#$%&\'()*+,\-./:;<=>?@\[\\\]^_`{|}~]+$'
 )]
+# Password 제약(공백 제거 후 출력 가능한 ASCII 12~64자)과 동일한 사전 필터 (fullmatch로 사용)
+# - 명백히 잘못된 입력은 Pydantic 검증 전에 거른다
+PASSWORD_PATTERN: re.Pattern = re.compile(r"[\x21-\x7e]{12,64}")
 
 UserName = Annotated[str, StringConstraints(
     strip_whitespace=True,      # 문자열 앞뒤 공백 제거
@@ -1,7 +1,7 @@
 """
 로그인/회원가입 유틸 함수 모음.
 
-- view_changer: 현재 화면(View) 변경 후 UI 리렌더링
+- view_changer: 현재 화면(View) 변경 (버튼 on_click 콜백용)
 - input_cleaner: 폼 입력값을 None/Boolean 등으로 정리
 - SignUpUniqueKeys: 회원가입 시 unique key(user_id, ktr_id, email) 중복 검사 처리
 - SignUpAction: 회원가입 버튼 클릭 시 FE 검증 → BE 호출
@@ -10,11 +10,12 @@
 """
 import streamlit as st
 
-from typing import Tuple, Dict, Optional, Union
-from pydantic import BaseModel, EmailStr
+from typing import Tuple, Dict, List, Optional, Union, Final
+from pydantic import BaseModel, EmailStr, ValidationError
 
 from app.api.p1_login import (
-    verify_unique_key, add_new_user, self_block, self_update
+    verify_unique_key, verify_unique_keys_batch, UniqueKeyCheckError,
+    add_new_user, self_block, self_update
 )
 from app.constants.keys import (
     SignupKey, LoginViews, SessionKey, UserUpdateInfo
@@ -22,11 +23,36 @@ from app.constants.keys import (
 from app.constants.messages import (
     LoginSignupMsg, LoginSelfBlockMsg, LoginSelfUpdateMsg
 )
-from app.schemas.p1_login import UniqueKeys, Password, UserName
+from app.schemas.p1_login import UniqueKeys, Password, UserName, PASSWORD_PATTERN
 from app.utils.session import SessControl
 from app.utils.utils import string_space_converter
 
 
+# 여러 검증 오류를 하나의 st.error로 출력할 때의 구분자 (Markdown 줄바꿈)
+_ERROR_SEP: Final[str] = "  \n"
+
+# 유니크 키 필드 정의 (인자명, 통과 여부 세션 키, 메시지 세션 키)
+_FIELDS: Final[Tuple[Tuple[str, str, str], ...]] = (
+    ("user_id", SignupKey.USER_ID, SignupKey.USER_ID_MSG),
+    ("ktr_id", SignupKey.KTR_ID, SignupKey.KTR_ID_MSG),
+    ("email", SignupKey.EMAIL, SignupKey.EMAIL_MSG),
+)
+# 중복검사 통과 여부 세션 키 / 라벨 (순서 일치)
+_KEY_ROCK_KEYS: Final[Tuple[str, str, str]] = (
+    SignupKey.USER_ID, SignupKey.KTR_ID, SignupKey.EMAIL
+)
+_KEY_ROCK_LABELS: Final[Tuple[str, str, str]] = ("계정", "사번", "이메일")
+# 중복검사 미통과 메시지 (제출마다 format 하지 않도록 import 시 1회 생성)
+_KEY_ROCK_MSGS: Final[Tuple[str, ...]] = tuple(
+    LoginSignupMsg.ENTER_TARGET_NOT_PASS.format(k=label) for label in _KEY_ROCK_LABELS
+)
+# 공란 검사 대상 라벨 (비밀번호, 비밀번호 확인, 사용자 이름 순서) / 메시지
+_EMPTY_LABELS: Final[Tuple[str, str, str]] = ("비밀번호", "비밀번호 확인", "사용자 이름")
+_EMPTY_MSGS: Final[Tuple[str, ...]] = tuple(
+    LoginSignupMsg.ENTER_TARGET_NULL.format(k=label) for label in _EMPTY_LABELS
+)
+
+
 # ==============================
 # Pydantic 기반 단일 필드 검증기
 # ==============================
@@ -50,7 +76,7 @@ class EmailCheck(BaseModel):
 # ==============================
 def view_changer(view_name: str):
     """
-    로그인 뷰 상태 전환 후 즉시 rerun.
+    로그인 뷰 상태 전환.
 
     매개변수
     --------
@@ -60,16 +86,15 @@ def view_changer(view_name: str):
     동작
     ----
     - 세션 상태(LoginViews.KEY)를 새로운 뷰로 변경
-    - 곧바로 st.rerun() 호출로 UI 재렌더링
+    - 버튼의 on_click 콜백으로 사용한다.
+      콜백 이후 Streamlit이 자동으로 재실행하므로 st.rerun()을 호출하지 않는다.
+    - 콜백이 아닌 본문에서 호출한 경우에는 호출자가 st.rerun()으로 화면을 갱신한다.
     """
-    # View 변경
     st.session_state[LoginViews.KEY] = view_name
-    # UI를 새로 그림
-    st.rerun()
 
 
 def input_cleaner(
-        value: str, 
+        value: Optional[Union[str, bool]], 
         is_boolean: bool = False
     ) -> Optional[Union[str, bool]]:
     """
@@ -78,13 +103,14 @@ def input_cleaner(
     목적
     ----
     - 폼 입력값을 다루기 쉽게 정규화:
-      * 공백/빈 문자열 → None
+      * None/공백/빈 문자열 → None
       * 불리언은 False를 None으로 취급(옵션)
+    - 각 Action의 진입점에서 1회만 적용하여, 하위 검증기는 빈값을 None으로만 판단한다.
 
     Parameters
     ----------
-    value : str
-        폼에서 받은 원본 문자열
+    value : Optional[Union[str, bool]]
+        폼에서 받은 원본 값
     is_boolean : bool, default False
         True면 False 값을 None으로 변환(미입력 취급)
 
@@ -96,7 +122,7 @@ def input_cleaner(
     if is_boolean:
         return None if not value else True
     
-    return None if value.strip() == "" else value
+    return None if value is None or value.strip() == "" else value
 
 
 
@@ -112,6 +138,8 @@ class SignUpUniqueKeys:
     - 버튼 색/메시지 상태 결정 (`set_condition`)
     - 메시지 출력 (`set_show_msg`)
     - 버튼 클릭 시 BE API 호출 및 세션 갱신 (`checker_action`)
+    - '중복 확인' 버튼의 on_click 콜백 진입점 (`checker_callback`)
+    - 유니크 키 입력값 형식 검증 (`validate_value`, SignUpAction에서도 사용)
     """
 
     @classmethod
@@ -141,6 +169,7 @@ class SignUpUniqueKeys:
         --------
         - 통과 여부(USER_ID/KTR_ID/EMAIL) → False
         - 메시지(USER_ID_MSG/KTR_ID_MSG/EMAIL_MSG) → None
+        - 일괄 중복검사 캐시(BATCH) → None
         - 개인정보 안내 화면에서 뒤로가기 시 등, 상태를 깨끗하게 리셋할 때 사용
         """
         # 중복 확인 결과 초기화
@@ -152,6 +181,9 @@ class SignUpUniqueKeys:
         st.session_state[SignupKey.KTR_ID_MSG] = None
         st.session_state[SignupKey.EMAIL_MSG] = None
 
+        # 일괄 중복검사 캐시 초기화
+        st.session_state[SignupKey.BATCH] = None
+
     @classmethod
     def set_condition(
             cls, 
@@ -201,6 +233,26 @@ class SignUpUniqueKeys:
             else:
                 st.error(message)
 
+    @classmethod
+    def checker_callback(cls, field: str, widget_key: str):
+        """
+        '중복 확인' 버튼의 on_click 콜백.
+
+        Parameters
+        ----------
+        field : str
+            검사 대상 인자명 ("user_id" | "ktr_id" | "email")
+        widget_key : str
+            입력 위젯(st.text_input)의 세션 키
+
+        Notes
+        -----
+        - 콜백은 클릭 직후의 최신 입력값을 보장하기 위해 위젯 값을 세션에서 직접 읽는다.
+        - 콜백 종료 후 Streamlit이 자동으로 (fragment 범위) 재실행하므로 st.rerun()이 필요 없다.
+        """
+        value = st.session_state.get(widget_key, "")
+        cls.checker_action(**{field: value})
+
     @classmethod
     def checker_action(
             cls, 
@@ -213,31 +265,37 @@ class SignUpUniqueKeys:
 
         Flow
         ----
-        1) 대상 키(user_id/ktr_id/email) 식별
+        1) 대상 키(user_id/ktr_id/email) 식별 (_classify, 1회)
         2) 입력값 유효성 검사(빈값/패턴 위반)
-        3) BE API 호출(verify_unique_key) → exists 여부 판단
+        3) BE API 호출(verify_unique_key) → exists 여부 판단 (실패 시 UniqueKeyCheckError → 통과 불가)
         4) 세션 상태 갱신(통과 여부/메시지)
-        5) st.rerun()으로 즉시 UI 갱신
+        - on_click 콜백에서 호출되며, UI 갱신은 콜백 이후의 자동 재실행에 맡긴다.
 
         Raises
         ------
         ValueError
             세 개 중 어느 것도 주어지지 않은 경우
         """
-        # 1) 대상 세션 키 식별
-        tg_key, tg_msg_key = cls._checker_action_key(user_id, ktr_id, email)
+        # 1) 대상 필드/세션 키 식별 (1회만 분류) 후 입력값 정리
+        key, value, tg_key, tg_msg_key = cls._classify(user_id, ktr_id, email)
+        value = input_cleaner(value)
 
         # 2) 값 검증
-        keep_going, msg = cls._checker_action_value(user_id, ktr_id, email)
+        keep_going, msg = cls.validate_value(key=key, value=value)
 
-        # 3) 백엔드 조회 (유효할 때만)
+        # 3) 백엔드 조회 (유효할 때만) - 캐시된 결과 재사용
         if keep_going:
-            duplicated, msg, _ = verify_unique_key(user_id, ktr_id, email)
+            try:
+                duplicated, msg, _ = verify_unique_key(**{key: value})
+            except UniqueKeyCheckError as e:
+                # 통신/파싱 실패 → 통과 불가 (실패 결과는 캐싱되지 않으므로 재시도 시 다시 조회)
+                st.session_state[tg_key] = False
+                st.session_state[tg_msg_key] = e.msg
+                return
         else:
-            # 형식 위반 → 세션 상태 업데이트 후 즉시 rerun
+            # 형식 위반 → 세션 상태 업데이트 후 종료
             st.session_state[tg_key] = False
             st.session_state[tg_msg_key] = msg
-            st.rerun()
             return
         
         # 4) 결과 반영
@@ -250,47 +308,60 @@ class SignUpUniqueKeys:
             st.session_state[tg_key] = True
             st.session_state[tg_msg_key] = msg
 
-        # 5. 즉시 UI 갱신
-        st.rerun()
-
     @classmethod
-    def _checker_action_key(
+    def _classify(
             cls, 
             user_id: Optional[str],
             ktr_id: Optional[str],
             email: Optional[str]
-        ) -> str:
+        ) -> Tuple[str, str, str, str]:
         """
-        어떤 unique key를 검사 중인지 결정하여 대응 세션 키를 반환.
+        어떤 unique key를 검사 중인지 결정하여 대상 필드와 대응 세션 키를 반환.
 
         Returns
         -------
-        (bool_key, msg_key) : Tuple[str, str]
-            예) user_id → (SignupKey.USER_ID, SignupKey.USER_ID_MSG)
-        """
-        # 대상 unique key 정의
-        if user_id is not None:
-            return SignupKey.USER_ID, SignupKey.USER_ID_MSG
-        elif ktr_id is not None:
-            return SignupKey.KTR_ID, SignupKey.KTR_ID_MSG
-        elif email is not None:
-            return SignupKey.EMAIL, SignupKey.EMAIL_MSG
-        else:
+        (key, value, bool_key, msg_key) : Tuple[str, str, str, str]
+            예) user_id → ("user_id", <입력값>, SignupKey.USER_ID, SignupKey.USER_ID_MSG)
+
+        Raises
+        ------
+        ValueError
+            세 개 중 어느 것도 주어지지 않은 경우
+        """
+        # 대상 unique key 정의 (_FIELDS 테이블에서 첫 번째 입력 필드 선택)
+        target = next(
+            (
+                (key, v, bool_key, msg_key)
+                for (key, bool_key, msg_key), v in zip(_FIELDS, (user_id, ktr_id, email))
+                if v is not None
+            ),
+            None
+        )
+        if target is None:
             raise ValueError(LoginSignupMsg.ENTER_TOO_MUCH)
+        return target
         
     @classmethod
-    def _checker_action_value(
+    def validate_value(
             cls, 
-            user_id: Optional[str],
-            ktr_id: Optional[str],
-            email: Optional[str]
+            key: str,
+            value: Optional[str]
         ) -> Tuple[bool, str]:
         """
-        입력값 검증 로직.
+        유니크 키 입력값 검증 로직 (BE 호출 전 형식 검사).
+
+        - 개별 중복 확인(checker_action)과 회원가입 일괄 중복검사(SignUpAction)에서 공용으로 사용한다.
+
+        Parameters
+        ----------
+        key : str
+            검사 대상 필드명 ("user_id" | "ktr_id" | "email")
+        value : Optional[str]
+            검사 대상 입력값 (input_cleaner 적용 후, 미입력은 None)
 
         Checks
         ------
-        - 빈 문자열 여부
+        - 미입력(None) 여부
         - Pydantic `UniqueKeys`로 패턴 검증
 
         Returns
@@ -299,25 +370,16 @@ class SignUpUniqueKeys:
             keep_going=True → BE 호출 가능
             keep_going=False → 오류 메시지 출력 후 중단
         """
-        # 값이 None이 아닌 것을 value로 정의
-        for k, v in {"user_id":user_id, "ktr_id":ktr_id, "email":email}.items():
-            if v is not None:
-                value = v
-                key = k
-                break
-
-        # 1) 빈값인 경우
-        if value == "":
-            keep_going = False
-            msg = LoginSignupMsg.ENTER_NULL
-            return keep_going, msg
+        # 1) 미입력인 경우
+        if value is None:
+            return False, LoginSignupMsg.ENTER_NULL
 
         # 2) 형식 검증 (Pydantic 모델)
         try:
-            UniqueKeys(user_id=user_id, ktr_id=ktr_id, email=email)
+            UniqueKeys(**{key: value})
             keep_going = True
             msg = None
-        except:
+        except ValidationError:
             keep_going = False
             msg = LoginSignupMsg.ENTER_OVER
             # user_id 오류 시 추가 안내 메시지 포함
@@ -350,48 +412,52 @@ class SignUpAction:
 
         Flow
         ----
-        0) user_name 공백 정규화
-        1) UNIQUE 키 중복검사 통과 여부 확인(세션 rock 확인)
-        2) 필수 입력값 공란 검사
-        3) 비밀번호/사용자명 형식 검증
-        4) 개인정보 수집 동의 확인
-        5) BE(add_new_user) 호출 → 결과 메시지 출력 및 rock 초기화
-        """
-        # 0) user_name 변환기(공백·양끝 정리 등)
-        user_name = string_space_converter(value=user_name)
-
-        # 1) UNIQUE key rock 확인
-        mask, msg = cls.check_keys_rock()
-        if mask:
-            st.error(msg)
-            return
+        0) 모든 입력값 정리(input_cleaner: 미입력 → None), user_name 공백 정규화
+        1) FE 검증을 한 번에 수행하여 오류 메시지를 모두 수집
+           - UNIQUE 키 중복검사 통과 여부(세션 rock)
+           - 필수 입력값 공란 / 비밀번호·사용자명 형식
+           - 개인정보 수집 동의
+        2) 오류가 있으면 한 번에 출력 후 중단 (수정-재실행 횟수 최소화)
+        3) BE(add_new_user) 호출 → 결과 메시지 출력 및 rock 초기화
 
-        # 2) 공란 검사
-        mask, msg = cls.check_pwd_and_username_empty(
+        Notes
+        -----
+        - 유니크 키 3종이 모두 입력되었고 아직 하나도 중복검사를 통과하지 않았다면,
+          preflight_unique_keys()가 일괄 중복검사를 먼저 수행한다.
+        """
+        # 0) 입력값 정리 (미입력/공백만 입력 → None) + user_name 변환기(공백·양끝 정리 등)
+        user_id = input_cleaner(user_id)
+        ktr_id = input_cleaner(ktr_id)
+        email = input_cleaner(email)
+        pwd_raw = input_cleaner(pwd_raw)
+        pwd_check = input_cleaner(pwd_check)
+        user_name = input_cleaner(string_space_converter(value=user_name))
+
+        # 0-1) 유니크 키 일괄 중복검사 (개별 버튼 3회 호출 대체)
+        cls.preflight_unique_keys(user_id=user_id, ktr_id=ktr_id, email=email)
+
+        # 1) FE 검증 - 모든 오류 수집
+        errors: List[str] = []
+        errors += cls.check_keys_rock()
+        errors += cls.check_pwd_and_username_empty(
             pwd_raw=pwd_raw,
             pwd_check=pwd_check,
             user_name=user_name
         )
-        if mask:
-            st.error(msg)
-            return
-
-        # 3) 형식/일치 검증
-        mask, msg = cls.check_pwd_and_username(
+        errors += cls.check_pwd_and_username(
             pwd_raw=pwd_raw,
             pwd_check=pwd_check,
             user_name=user_name
         )
-        if mask:
-            st.error(msg)
-            return
-        
-        # 4) 개인정보 수집 동의
         if not p_info_agree:
-            st.error(LoginSignupMsg.PERSONAL_INFO_NOT_AGREE)
+            errors.append(LoginSignupMsg.PERSONAL_INFO_NOT_AGREE)
+
+        # 2) 오류 일괄 출력
+        if errors:
+            st.error(_ERROR_SEP.join(errors))
             return
         
-        # 5) 회원가입 BE 호출
+        # 3) 회원가입 BE 호출
         mask, msg, _ = add_new_user(
             user_id=user_id,
             ktr_id=ktr_id,
@@ -410,30 +476,82 @@ class SignUpAction:
                 st.info(msg)
             # 확인 키 초기화
             SignUpUniqueKeys.keys_rock_init()
+            # 신규 키가 등록되었으므로 중복 확인 캐시 무효화
+            verify_unique_key.clear()
         else:
             st.error(msg)
 
 
     @classmethod
-    def check_keys_rock(cls) -> Tuple[bool, Optional[str]]:
+    def preflight_unique_keys(
+            cls,
+            user_id: str,
+            ktr_id: str,
+            email: str
+        ):
+        """
+        유니크 키 3종을 한 번의 일괄 호출로 중복검사하고 결과를 세션에 반영.
+
+        Conditions
+        ----------
+        - 세 값이 모두 입력되어 있고, 아직 어떤 키도 중복검사를 통과하지 않은 경우에만 수행.
+        - 동일한 (user_id, ktr_id, email) 조합의 결과는 세션(SignupKey.BATCH)에 캐싱되어
+          재제출 시 BE를 다시 호출하지 않는다. (통신 실패 결과는 캐싱하지 않음)
+
+        Flow
+        ----
+        1) 각 값의 형식 검증 → 하나라도 위반 시 해당 메시지만 세션에 반영하고 종료
+        2) verify_unique_keys_batch() 호출 (세션 캐시 우선)
+        3) 키별 통과 여부/메시지를 세션에 반영
+        """
+        ss = st.session_state
+        values = {"user_id":user_id, "ktr_id":ktr_id, "email":email}
+        if not all(values.values()) or any(ss[bool_key] for _, bool_key, _ in _FIELDS):
+            return
+
+        # 1) 형식 검증
+        formats = {
+            key: SignUpUniqueKeys.validate_value(key=key, value=value)
+            for key, value in values.items()
+        }
+        if not all(keep_going for keep_going, _ in formats.values()):
+            for key, bool_key, msg_key in _FIELDS:
+                ss[bool_key] = False
+                ss[msg_key] = formats[key][1]
+            return
+
+        # 2) 일괄 조회 (동일 입력 조합이면 세션 캐시 재사용)
+        triple = (user_id, ktr_id, email)
+        cached = ss.get(SignupKey.BATCH)
+        if cached is not None and cached[0] == triple:
+            results = cached[1]
+        else:
+            results = verify_unique_keys_batch(user_id, ktr_id, email)
+            if all(duplicated is not None for duplicated, _, _ in results.values()):
+                ss[SignupKey.BATCH] = (triple, results)
+
+        # 3) 결과 반영 (중복 여부가 명확히 False인 경우만 통과)
+        for key, bool_key, msg_key in _FIELDS:
+            duplicated, msg, _ = results[key]
+            ss[bool_key] = duplicated is False
+            ss[msg_key] = msg
+
+    @classmethod
+    def check_keys_rock(cls) -> List[str]:
         """
         세션에 저장된 중복검사 통과 여부를 점검.
 
         Returns
         -------
-        (is_error, message)
-            통과하지 않은 키가 있으면 True와 메시지 반환
-        """
-        # 순회하면서 UNIQUE key 확인 결과 반환
-        duplicated_rock = {
-            "계정":st.session_state[SignupKey.USER_ID],
-            "사번":st.session_state[SignupKey.KTR_ID],
-            "이메일":st.session_state[SignupKey.EMAIL],
-        }
-        for k, v in duplicated_rock.items():
-            if not v:
-                return True, LoginSignupMsg.ENTER_TARGET_NOT_PASS.format(k=k)
-        return False, None
+        List[str]
+            통과하지 않은 키별 오류 메시지 (모두 통과 시 빈 리스트)
+        """
+        # 순회하면서 UNIQUE key 확인 결과 수집 (메시지는 사전 포맷된 값 사용)
+        ss = st.session_state
+        return [
+            msg for k, msg in zip(_KEY_ROCK_KEYS, _KEY_ROCK_MSGS, strict=True)
+            if not ss[k]
+        ]
     
     @classmethod
     def check_pwd_and_username_empty(
@@ -441,20 +559,20 @@ class SignUpAction:
             pwd_raw: str,
             pwd_check: str,
             user_name: str
-        ) -> Tuple[bool, Optional[str]]:
+        ) -> List[str]:
         """
         비밀번호/비번확인/사용자이름의 공란 여부를 확인.
+
+        Returns
+        -------
+        List[str]
+            비어있는 필드별 오류 메시지 (모두 입력 시 빈 리스트)
         """
-        # 순회하면서 비어있는지 확인
-        empty_check = {
-            "비밀번호":pwd_raw,
-            "비밀번호 확인":pwd_check,
-            "사용자 이름":user_name
-        }
-        for k, v in empty_check.items():
-            if not v:
-                return True, LoginSignupMsg.ENTER_TARGET_NULL.format(k=k)
-        return False, None
+        # 순회하면서 비어있는지 확인 (메시지는 사전 포맷된 값 사용)
+        return [
+            msg for msg, v in zip(_EMPTY_MSGS, (pwd_raw, pwd_check, user_name), strict=True)
+            if not v
+        ]
         
     @classmethod
     def check_pwd_and_username(
@@ -462,35 +580,45 @@ class SignUpAction:
             pwd_raw: str,
             pwd_check: str,
             user_name: str
-        ) -> Tuple[bool, Optional[str]]:
+        ) -> List[str]:
         """
         비밀번호 일치/형식 및 사용자명 형식을 검증.
 
+        Notes
+        -----
+        - 공란인 필드는 check_pwd_and_username_empty()에서 보고하므로 건너뛴다.
+
         Returns
         -------
-        (is_error, message)
+        List[str]
+            형식/일치 오류 메시지 (모두 통과 시 빈 리스트)
         """
-        # pwd_raw와 pwd_check가 불일치 하는 경우
-        if pwd_raw != pwd_check:
-            return True, LoginSignupMsg.PWD_MISSMATCH
-        
-        # 비밀번호 형식 확인
-        try:
-            PasswordCheck(pwd=pwd_raw)
-        except:
-            return True, (
-                LoginSignupMsg.ENTER_WRONG_PWD 
-                + f" ({LoginSignupMsg.PWD_PAT})"
-            )
+        errors: List[str] = []
+
+        if pwd_raw:
+            # pwd_raw와 pwd_check가 불일치 하는 경우
+            if pwd_check and pwd_raw != pwd_check:
+                errors.append(LoginSignupMsg.PWD_MISSMATCH)
+
+            # 비밀번호 형식 확인
+            try:
+                PasswordCheck(pwd=pwd_raw)
+            except ValidationError:
+                errors.append(
+                    LoginSignupMsg.ENTER_WRONG_PWD 
+                    + f" ({LoginSignupMsg.PWD_PAT})"
+                )
+
         # 사용자 이름 형식 확인
-        try:
-            UserNameCheck(name=user_name)
-        except:
-            return True, (
-                LoginSignupMsg.ENTER_WRONG_USERNAME 
-                + f"({LoginSignupMsg.USER_NAME_PAT})"
-            )
-        return False, None
+        if user_name:
+            try:
+                UserNameCheck(name=user_name)
+            except ValidationError:
+                errors.append(
+                    LoginSignupMsg.ENTER_WRONG_USERNAME 
+                    + f"({LoginSignupMsg.USER_NAME_PAT})"
+                )
+        return errors
 
 
 
@@ -502,7 +630,7 @@ class EditAction:
     @classmethod
     def run(
             cls, 
-            pwd_current: str, 
+            pwd_current: Optional[str], 
             user_name: Optional[str],
             developer: Optional[bool],
             email: Optional[str],
@@ -514,22 +642,24 @@ class EditAction:
 
         Flow
         ----
-        1) 현재 비밀번호 형식 검증(미입력/잘못된 형식 방지)
-        2) 값 검증(모두 미입력, 이메일 형식·중복락, 비밀번호 규칙 등)
+        0) 모든 입력값 정리(input_cleaner: 미입력 → None), user_name 공백 정규화
+        1) FE 검증을 한 번에 수행하여 오류 메시지를 모두 수집
+           - 현재 비밀번호 입력/형식
+           - 모두 미입력, 이메일 형식·중복락, 비밀번호 규칙 등
+        2) 오류가 있으면 한 번에 출력 후 중단
         3) BE(self_update) 호출
         4) 성공 시 메시지 출력/세션 반영/락 초기화
         """
-        # 0) user_name 정규화
-        user_name = string_space_converter(value=user_name)
-
-        # 1) 현재 비밀번호 인증
-        mask, msg = cls._pwd_current_check(pwd_current)
-        if mask:
-            st.error(msg)
-            return
+        # 0) 입력값 정리 (미입력/공백만 입력 → None) + user_name 정규화
+        pwd_current = input_cleaner(pwd_current)
+        user_name = input_cleaner(string_space_converter(value=user_name))
+        developer = input_cleaner(developer, is_boolean=True)
+        email = input_cleaner(email)
+        pwd_new_raw = input_cleaner(pwd_new_raw)
+        pwd_new_check = input_cleaner(pwd_new_check)
 
-        # 2) 입력값 확인
-        mask, msg = cls._value_check(
+        # 1) 입력값 확인 - 모든 오류 수집
+        errors = cls._value_check(
             user_name=user_name,
             developer=developer,
             email=email,
@@ -537,8 +667,9 @@ class EditAction:
             pwd_new_raw=pwd_new_raw,
             pwd_new_check=pwd_new_check
         )
-        if mask:
-            st.error(msg)
+        # 2) 오류 일괄 출력
+        if errors:
+            st.error(_ERROR_SEP.join(errors))
             return
 
         # 3) 백엔드 API 전달
@@ -557,6 +688,7 @@ class EditAction:
             st.info(msg)
             cls._session_update(result=result)      # 세션 표기값 갱신
             SignUpUniqueKeys.keys_rock_init()       # 이메일 락 등 초기화
+            verify_unique_key.clear()               # 이메일 변경 시 중복 확인 캐시 무효화
         else:
             st.error(msg)
 
@@ -569,13 +701,13 @@ class EditAction:
         현재 비밀번호 입력/형식 검증.
         """
         # 현재 비밀번호 미입력
-        if pwd_current == "" or pwd_current is None:
+        if pwd_current is None:
             return True, LoginSelfUpdateMsg.CURRENT_PWD_NULL
         # 비밀번호 인증기
         try:
             PasswordCheck(pwd=pwd_current)
             return False, None
-        except:
+        except ValidationError:
             return True, LoginSelfUpdateMsg.CURRENT_PWD_WRONG
 
     @classmethod    
@@ -587,36 +719,36 @@ class EditAction:
             pwd_current:str,
             pwd_new_raw: Optional[str],
             pwd_new_check: Optional[str]
-        ) -> Tuple[bool, Optional[str]]:
-        """
-        수정 요청 값들의 유효성 검증(모두 빈값, 이메일, 비밀번호 규칙).
+        ) -> List[str]:
         """
-        # 1) 모두 미입력 여부
-        mask, msg = cls._check_all_null(
-            user_name=user_name,
-            developer=developer,
-            email=email,
-            pwd_new_raw=pwd_new_raw,
-            pwd_new_check=pwd_new_check
-        )
-        if mask:
-            return mask, msg
-        
-        # 2) 이메일 형식/락 확인 (입력 시에만)
-        mask, msg = cls._check_email(email=email)
-        if mask:
-            return mask, msg
+        수정 요청 값들의 유효성 검증(현재 비밀번호, 모두 빈값, 이메일, 비밀번호 규칙).
 
-        # 3) 비밀번호 규칙/중복 확인
-        mask, msg = cls._check_password(
-            pwd_current=pwd_current,
-            pwd_new_raw=pwd_new_raw,
-            pwd_new_check=pwd_new_check
+        Returns
+        -------
+        List[str]
+            실패한 검증의 오류 메시지 (모두 통과 시 빈 리스트)
+        """
+        checks = (
+            # 1) 현재 비밀번호 인증
+            cls._pwd_current_check(pwd_current),
+            # 2) 모두 미입력 여부
+            cls._check_all_null(
+                user_name=user_name,
+                developer=developer,
+                email=email,
+                pwd_new_raw=pwd_new_raw,
+                pwd_new_check=pwd_new_check
+            ),
+            # 3) 이메일 형식/락 확인 (입력 시에만)
+            cls._check_email(email=email),
+            # 4) 비밀번호 규칙/중복 확인
+            cls._check_password(
+                pwd_current=pwd_current,
+                pwd_new_raw=pwd_new_raw,
+                pwd_new_check=pwd_new_check
+            )
         )
-        if mask:
-            return mask, msg
-        
-        return False, None
+        return [msg for mask, msg in checks if mask]
                 
     @classmethod
     def _check_all_null(
@@ -657,7 +789,7 @@ class EditAction:
             try:
                 EmailCheck(email=email)
                 return cls._check_email_rock()      # Email rock 확인
-            except:
+            except ValidationError:
                 return True, LoginSelfUpdateMsg.EMAIL_CHECK_NEED
         return False, None
 
@@ -696,7 +828,7 @@ class EditAction:
             try:
                 PasswordCheck(pwd=pwd_new_raw)
                 return False, None
-            except:
+            except ValidationError:
                 return True, (
                     LoginSignupMsg.ENTER_WRONG_PWD 
                     + f" ({LoginSignupMsg.PWD_PAT})"
@@ -769,10 +901,37 @@ class SoftDeleteAction:
         # 비밀번호 미입력
         if password is None or password == "":
             return True, LoginSelfBlockMsg.PWD_NULL
-        
+
+        # 형식 사전 필터 - 명백히 잘못된 비밀번호는 Pydantic 검증 없이 바로 반환
+        if not PASSWORD_PATTERN.fullmatch(password.strip()):
+            return True, LoginSelfBlockMsg.PWD_WRONG
+
         try:
             PasswordCheck(pwd=password)
             return False, None
-        except:
+        except ValidationError:
             # 잘못된 비밀번호 입력 - 형식 오류 - 백엔드와 동일 오류 반환
-            return True, LoginSelfBlockMsg.PWD_WRONG
\ No newline at end of file
+            return True, LoginSelfBlockMsg.PWD_WRONG
+
+
+
+# ==============================
+# Pydantic 검증기 워밍업
+# ==============================
+def _warmup_validators():
+    """
+    모듈 import 시 검증 모델을 미리 준비하여 첫 입력 시의 지연을 제거.
+
+    - model_rebuild(): 지연된 core-schema가 있다면 이 시점에 완성 (이미 완성된 경우 no-op)
+    - 유효한 샘플 1회 검증: 검증기의 최초 호출 경로(이메일 검증 모듈 등)를 서버 기동 시점에 실행
+    """
+    for model in (UniqueKeys, PasswordCheck, UserNameCheck, EmailCheck):
+        model.model_rebuild()
+
+    UniqueKeys(user_id="warmup", ktr_id="10000000", email="warmup@example.com")
+    PasswordCheck(pwd="warmup-password")
+    UserNameCheck(name="warmup")
+    EmailCheck(email="warmup@example.com")
+
+
+_warmup_validators()
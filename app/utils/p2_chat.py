@@ -3,6 +3,9 @@
 
 - Response: 사용자 입력을 백엔드 API에 전송하고, 스트리밍 응답을 UI에 실시간 표시.
 """
+import io
+from typing import Iterator
+
 import streamlit as st
 
 from app.api.p2_chat import streaming_response
@@ -27,7 +30,7 @@ class Response:
         # 1. 중단 상태 확인 (재실행 시 진입점)
         if st.session_state.get(SessionKey.STOP_STREAM, False):
             # 중단된 시점까지 저장된 텍스트가 있다면 불러오기
-            interrupted_txt = st.session_state.get(SessionKey.TEMP_RESPONSE, "")
+            interrupted_txt = cls._temp_response_text()
             if interrupted_txt:
                 # 마지막에 중단 메시지 추가
                 interrupted_txt += ChatMsg.INTERRUPT
@@ -37,8 +40,9 @@ class Response:
             st.rerun()
             return
         
-        # 2. 정상 시작 전 초기화
-        st.session_state[SessionKey.TEMP_RESPONSE] = ""
+        # 2. 정상 시작 전 초기화 - 응답 누적 버퍼(중단 시 복원용으로 세션에 보관)
+        buf = io.StringIO()
+        st.session_state[SessionKey.TEMP_RESPONSE] = buf
         # 대화의 request_id 추가
         st.session_state[SessionKey.CHAT_REQUEST_ID] = make_request_id()
 
@@ -48,17 +52,43 @@ class Response:
 
         # 3. 스트리밍 표시
         with st.chat_message(ChatRoles.ASSISTANT):
-            # 스트리밍 응답 실시간 렌더링 - streaming_response 제너레이터가 yield하는 텍스트 조각
-            full_response = st.write_stream(streaming_response(payload=payload))
+            # 스트리밍 응답 실시간 렌더링 - 텍스트 조각은 buf에만 누적하고 완료 후 1회 읽는다
+            st.write_stream(cls._buffered_stream(payload=payload, buf=buf))
+        full_response = buf.getvalue()
 
         # 4. 완료 후 저장
         if full_response:
-            cls._save_response(str(full_response))
+            cls._save_response(full_response)
 
         # 4. 상태 정리
         cls._cleanup_state()
         st.rerun()
 
+    @classmethod
+    def _buffered_stream(
+            cls, 
+            payload: dict[str, str], 
+            buf: io.StringIO
+        ) -> Iterator[str]:
+        """
+        streaming_response의 텍스트 조각을 buf에 기록하면서 그대로 전달하는 어댑터.
+
+        Args:
+            payload (dict[str, str]): Chat API 요청 payload
+            buf (io.StringIO): 응답 누적 버퍼 (세션의 SessionKey.TEMP_RESPONSE)
+        """
+        for txt in streaming_response(payload=payload):
+            buf.write(txt)
+            yield txt
+
+    @classmethod
+    def _temp_response_text(cls) -> str:
+        """
+        세션에 보관된 응답 누적 버퍼의 현재 텍스트를 반환. (버퍼가 없으면 "")
+        """
+        buf = st.session_state.get(SessionKey.TEMP_RESPONSE)
+        return buf.getvalue() if buf is not None else ""
+
     @classmethod
     def _convert_to_txt_dict(cls) -> dict[str, str]:
         """
@@ -124,4 +154,4 @@ class Response:
         """상태 정리 공통 로직"""
         st.session_state[SessionKey.STREAMING] = False
         st.session_state[SessionKey.STOP_STREAM] = False
-        st.session_state[SessionKey.TEMP_RESPONSE] = ""
+        st.session_state[SessionKey.TEMP_RESPONSE] = None
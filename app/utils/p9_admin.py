@@ -1,8 +1,10 @@
-from typing import Optional, List, Tuple
-from pydantic import BaseModel
+from typing import Optional, List, Tuple, Dict
+from copy import deepcopy
+from pydantic import BaseModel, ValidationError
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 
 from st_aggrid import (
     AgGrid, GridOptionsBuilder, GridUpdateMode, 
@@ -19,7 +21,7 @@ from app.constants.values import AdminUserTable, Ratio
 from app.constants.messages import AdminMsg
 from app.utils.p9_df_handler import UserTable
 from app.utils.utils import Flash
-from app.schemas.p1_login import Password
+from app.schemas.p1_login import Password, PASSWORD_PATTERN
 
 
 # ============================================================
@@ -82,7 +84,9 @@ def delete_confirm_dialog(idxes: List[int]):
     UX
     --
     - '취소' 클릭: 변경 없이 Flash만 띄우고 종료(재렌더).
-    - '삭제' 클릭: API 호출 → Flash → DB 재조회 → 재렌더.
+    - '삭제' 클릭: API 호출 → SideBarAction.after_modify() → 재렌더.
+        - 성공: Flash → GetTable.apply_diff()로 세션 DF에서 해당 행만 제거 (DB 재조회 없음)
+        - 실패/오류: Flash → DB 재조회(GetTable.base)로 실제 상태와 동기화
     """
     # 모달 표시
     _n = len(idxes)
@@ -99,8 +103,8 @@ def delete_confirm_dialog(idxes: List[int]):
             use_container_width=True, 
             disabled=st.session_state[AdminUserModify.DELETE_WAIT]
         ):
-            # 사용자 취소 안내 후 리런
-            SideBarAction.interupt_flash_msg(msg=AdminMsg.CANCEL_MODIFY)
+            # 사용자 취소 안내 후 리런 (모달을 닫아야 하므로 항상 rerun)
+            SideBarAction.interupt_flash_msg(msg=AdminMsg.CANCEL_MODIFY, force=True)
 
     with col2:
         if st.button(
@@ -115,7 +119,7 @@ def delete_confirm_dialog(idxes: List[int]):
                 mask, msg, _ = modify_bulk_delete(idxes=idxes)
             # disabled 해제
             st.session_state[AdminUserModify.DELETE_WAIT] = False
-            SideBarAction.after_modify(mask, msg)
+            SideBarAction.after_modify(mask, msg, diff=("delete", idxes, True))
 
 
 
@@ -125,8 +129,17 @@ def delete_confirm_dialog(idxes: List[int]):
 class GetTable:
     """
     Users Table 조회/가공 유틸 클래스.
-    - API → DataFrame 변환 → 뷰별 하위 DF 분리 → session_state 저장
+    - API → DataFrame 변환 → 뷰별 필터 마스크 생성 → session_state 저장
+    - 세션에는 전체 DF(TABLE_ALL) 1개와 뷰별 bool 마스크만 저장하고,
+      뷰별 DF는 view()에서 렌더링 시점에 만든다. (세션 메모리 절감)
+    - 조작 성공 후에는 apply_diff()로 세션 DF만 갱신하고,
+      DB 전체 재조회(base)는 'DB 조회' 버튼과 조작 실패/오류 시에만 수행한다.
     """
+    # 조작 종류 → (상태 컬럼, 경과일수 컬럼)
+    _DIFF_COLUMNS: Dict[str, Tuple[str, str]] = {
+        "signup": ("승인여부", "승인일수"),
+        "block": ("정지여부", "정지일수"),
+    }
 
     @classmethod
     def base(cls):
@@ -138,10 +151,8 @@ class GetTable:
         1) UserTable.all() 로 전체 DF 조회
         2) 실패 시 st.error
         3) 성공 시:
-           - AdminViews.TABLE_ALL
-           - AdminViews.TABLE_SIGNUP (승인여부 == False)
-           - AdminViews.TABLE_BLOCK  (정지여부 == True)
-           - AdminViews.TABLE_DEVELOPER (권한 == 'developer')
+           - AdminViews.TABLE_ALL (전체 DF)
+           - 뷰별 마스크(_set_masks): TABLE_SIGNUP / TABLE_BLOCK / TABLE_DEVELOPER / TABLE_CLAER
            를 세션에 저장한다.
         """
         # 전체 DB 조회
@@ -152,14 +163,90 @@ class GetTable:
             st.error(msg)
             return
         
-        # 정상 데이터 조회 시, 출력할 Table들 모두 생성
+        # 정상 데이터 조회 시, 전체 DF와 뷰별 마스크 저장
         st.session_state[AdminViews.TABLE_ALL] = df
-        st.session_state[AdminViews.TABLE_SIGNUP] = df[df["승인여부"] == "False"]
-        st.session_state[AdminViews.TABLE_BLOCK] = df[df["정지여부"] == "True"]
-        st.session_state[AdminViews.TABLE_DEVELOPER] = df[df["권한"] == "developer"]
-        # Clear는 조회될 수 없는 값을 조회하여, 선택된 행을 취소하는 방법을 사용
-        st.session_state[AdminViews.TABLE_CLAER] = df[df["idx"].isna()]
-            
+        cls._set_masks(df)
+
+    @classmethod
+    def _set_masks(cls, df: pd.DataFrame):
+        """
+        전체 DF로부터 뷰별 bool 마스크(행당 1 byte)를 계산하여 세션에 저장한다.
+        - 승인여부/정지여부/권한은 범주형이므로 Series 상태로 비교(코드 비교)한 뒤 ndarray로 저장
+        """
+        ss = st.session_state
+        ss[AdminViews.MASK_KEY.format(table=AdminViews.TABLE_SIGNUP)] = \
+            (df["승인여부"] == "False").to_numpy()
+        ss[AdminViews.MASK_KEY.format(table=AdminViews.TABLE_BLOCK)] = \
+            (df["정지여부"] == "True").to_numpy()
+        ss[AdminViews.MASK_KEY.format(table=AdminViews.TABLE_DEVELOPER)] = \
+            (df["권한"] == "developer").to_numpy()
+        # Clear는 어떤 행도 선택되지 않는 마스크로, 선택된 행을 취소하는 방법을 사용
+        ss[AdminViews.MASK_KEY.format(table=AdminViews.TABLE_CLAER)] = \
+            np.zeros(len(df), dtype=bool)
+
+    @classmethod
+    def apply_diff(cls, kind: str, idxes: List[int], way: bool = True):
+        """
+        조작 결과(대상 idx + 새 상태)를 세션의 전체 DF에 직접 반영한다.
+        - DB 재조회 없이 O(|idxes|) 갱신 후 뷰 마스크와 BLOCK idx 집합만 다시 만든다.
+
+        Parameters
+        ----------
+        kind : {'signup', 'block', 'delete'}
+            조작 종류
+        idxes : List[int]
+            조작 대상 idx
+        way : bool
+            signup/block의 새 상태 (delete는 무시)
+        """
+        df: pd.DataFrame = st.session_state[AdminViews.TABLE_ALL]
+
+        # idx는 zero-padding된 문자열이므로 같은 자릿수로 맞춰 비교
+        width = len(df[UsersRecord.idx].iat[0]) if len(df) else 0
+        rows = df[UsersRecord.idx].isin(
+            [str(i).zfill(width) for i in idxes]
+        ).to_numpy()
+
+        if kind == "delete":
+            # Hard-delete: 대상 행 제거
+            df = df[~rows].reset_index(drop=True)
+            st.session_state[AdminViews.TABLE_ALL] = df
+        else:
+            # 상태 변경: 'True'/'False' 갱신 + 경과일수는 0(설정) 또는 결측(해제)
+            state_col, interval_col = cls._DIFF_COLUMNS[kind]
+            df.loc[rows, state_col] = str(way)
+            df.loc[rows, interval_col] = (
+                (str(0) if AdminUserTable.DT_SHOW_ONLY_DATE else str(pd.Timedelta(0)))
+                if way else None
+            )
+
+        # 변경된 DF 기준으로 뷰 마스크 / 방어용 idx 집합 재계산
+        cls._set_masks(df)
+        UserTable._key_idxes_add_to_session(df=df)
+
+    @classmethod
+    def view(cls, key: str) -> pd.DataFrame:
+        """
+        세션의 전체 DF와 뷰 마스크로 key에 해당하는 DF를 만든다.
+
+        Parameters
+        ----------
+        key : str
+            AdminViews.TABLE_* (TABLE_ALL은 전체 DF 그대로 반환)
+
+        Returns
+        -------
+        pd.DataFrame
+            마스크가 없거나 길이가 맞지 않으면 빈 DF
+        """
+        df: pd.DataFrame = st.session_state[AdminViews.TABLE_ALL]
+        if key == AdminViews.TABLE_ALL:
+            return df
+        mask = st.session_state.get(AdminViews.MASK_KEY.format(table=key))
+        if mask is None or len(mask) != len(df):
+            return df.iloc[0:0]
+        return df[mask]
+
     @classmethod
     def one_user(cls, user_id: Optional[str]):
         """
@@ -172,7 +259,7 @@ class GetTable:
         Behavior
         --------
         - 조건 미충족 시 에러 안내.
-        - 조건 충족 시 필터링된 DF를 AdminViews.TABLE_USER_ID 에 저장.
+        - 조건 충족 시 필터 마스크를 AdminViews.TABLE_USER_ID 마스크 키에 저장.
         """
         # 렌더링 대상을 아직 조회하지 않은 경우
         if AdminViews.TABLE_ALL not in st.session_state:
@@ -182,7 +269,55 @@ class GetTable:
         # user_id 조회
         df: pd.DataFrame = st.session_state[AdminViews.TABLE_ALL]
         # 조회 결과에 따른 출력 - 결과가 없더라도 비어있는 df가 출력되므로 괜찮음
-        st.session_state[AdminViews.TABLE_USER_ID] = df[df["ID"] == user_id].copy()
+        st.session_state[AdminViews.MASK_KEY.format(table=AdminViews.TABLE_USER_ID)] = \
+            df["ID"].to_numpy() == user_id
+
+
+
+# ============================================================
+#  AgGrid 옵션 캐시
+#  - 옵션은 행 데이터가 아니라 컬럼 구성에만 의존하므로 컬럼 튜플 기준으로 1회 생성
+# ============================================================
+@st.cache_resource(show_spinner=False)
+def _build_grid_options(columns: Tuple[str, ...], _schema: pd.DataFrame) -> dict:
+    """
+    컬럼 구성별 AgGrid gridOptions(dict) 원본(template)을 생성하여 캐싱한다.
+    (cache_resource는 같은 객체를 공유하므로 호출부에서 복사본을 사용해야 한다)
+
+    Parameters
+    ----------
+    columns : Tuple[str, ...]
+        캐시 키로 사용하는 컬럼명 튜플
+    _schema : pd.DataFrame
+        컬럼 dtype 추론용 0행 DF (밑줄 인자는 캐시 키에서 제외됨)
+
+    Notes
+    -----
+    - 멀티선택(체크박스 + 클릭 토글) 활성화
+    - getRowId는 문자열 반환으로 안정화
+    - (표가 넓어져 idx 숨김은 현재 비활성)
+    """
+    # Option 구성
+    gb = GridOptionsBuilder.from_dataframe(_schema)
+    # 컬럼 넓이 자동 맞춤
+    gb.configure_default_column(resizable=True, filter=True, sortable=True)
+    # 체크박스 보이게 + 행 클릭만으로도 멀티 선택 토글 허용
+    gb.configure_selection(
+        selection_mode="multiple",
+        use_checkbox=True,
+        rowMultiSelectWithClick=True
+    )
+    # 행 클릭 선택 허용 (suppress = False)
+    gb.configure_grid_options(
+        suppressRowClickSelection=False,
+        rowSelection="multiple",
+        # getRowId는 문자열 반환이 더 안정적
+        getRowId=JsCode("function(params) { return String(params.data.idx); }"),
+    )
+    # 특정 컬럼 숨기기 (idx는 내부 식별용으로 두고 표시 숨김) - 표가 넓어져서 하지 않음
+    if not AdminUserTable:
+        gb.configure_column(UsersRecord.idx, hide=True)
+    return gb.build()
 
 
 
@@ -211,8 +346,8 @@ class ShowTable:
             st.error('"DB 조회"를 먼저 하십시오.')
             return
         
-        # 현재 세션에 저장된 대상 DF을 꺼내온다
-        df: pd.DataFrame = st.session_state[key]
+        # 현재 세션의 전체 DF + 뷰 마스크로 대상 DF을 만든다
+        df: pd.DataFrame = GetTable.view(key)
         grid_respons = cls._table_rendering_inner(df)       # AgGrid 렌더링
 
         # 선택된 행들의 원본 record dict 리스트 → DataFrame → idx 리스트 추출
@@ -254,42 +389,25 @@ class ShowTable:
             gridOptions=gb_option,
             height=Ratio.ADMIN_TABLE_SIZE,
             data_return_mode=DataReturnMode.FILTERED_AND_SORTED,    # 필터/정렬 반영한 데이터 반환
-            update_mode=GridUpdateMode.SELECTION_CHANGED,           # 선택 변경 시에만 rerun 트리거
+            update_mode=GridUpdateMode.MANUAL,                      # 행 클릭마다 rerun하지 않고, 표의 'Update' 버튼 클릭 시에만 선택 반영
             fit_columns_on_grid_load=True,
             allow_unsafe_jscode=True,                               # JsCode 사용 시 필요
-            key="users_aggrid"                                      # 키 고정으로 상태 안정
+            # 조작(after_modify)마다 증가하는 TABLE_VERSION을 키에 포함
+            # - MANUAL 모드는 'Update' 전까지 직전 선택을 계속 반환하므로, 조작 후에는 표를 새로 만들어
+            #   이미 처리된(삭제된 행 포함) 선택이 INDEX_LIST로 되살아나지 않게 한다.
+            key=f"users_aggrid_{st.session_state.get(AdminUserModify.TABLE_VERSION, 0)}"
         )
         return grid_response
 
     @classmethod
-    def _grid_option(cls, df: pd.DataFrame) -> GridOptionsBuilder:
-        """
-        AgGrid 옵션 구성.
-        - 멀티선택(체크박스 + 클릭 토글) 활성화
-        - getRowId는 문자열 반환으로 안정화
-        - (표가 넓어져 idx 숨김은 현재 비활성)
-        """
-        # Option 구성
-        gb = GridOptionsBuilder.from_dataframe(df)
-        # 컬럼 넓이 자동 맞춤
-        gb.configure_default_column(resizable=True, filter=True, sortable=True)
-        # 체크박스 보이게 + 행 클릭만으로도 멀티 선택 토글 허용
-        gb.configure_selection(
-            selection_mode="multiple",
-            use_checkbox=True,
-            rowMultiSelectWithClick=True
-        )
-        # 행 클릭 선택 허용 (suppress = False)
-        gb.configure_grid_options(
-            suppressRowClickSelection=False,
-            rowSelection="multiple",
-            # getRowId는 문자열 반환이 더 안정적
-            getRowId=JsCode("function(params) { return String(params.data.idx); }"),
-        )
-        # 특정 컬럼 숨기기 (idx는 내부 식별용으로 두고 표시 숨김) - 표가 넓어져서 하지 않음
-        if not AdminUserTable:
-            gb.configure_column(UsersRecord.idx, hide=True)
-        return gb.build()
+    def _grid_option(cls, df: pd.DataFrame) -> dict:
+        """
+        AgGrid 옵션 조회.
+        - 컬럼 구성이 같으면 _build_grid_options()의 캐시 결과를 사용한다.
+        - st_aggrid가 렌더 시 gridOptions를 제자리에서 변환(JsCode 직렬화)하므로,
+          세션/rerun 간 공유되는 캐시 원본 대신 깊은 복사본을 넘긴다.
+        """
+        return deepcopy(_build_grid_options(tuple(df.columns), df.iloc[0:0]))
     
     @classmethod
     def utils(cls, df: pd.DataFrame):
@@ -304,7 +422,7 @@ class ShowTable:
 
         with col1:
             st.caption(f"총 행: {len(df):,}")
-            st.caption(f"선택 행: {len(selected_idxes):,}")
+            st.caption(f"선택 행: {len(selected_idxes):,} (행 선택 후 표의 'Update' 버튼으로 반영)")
 
         with col2:
             st.caption(f"선택 index: {selected_idxes}")
@@ -343,7 +461,7 @@ class SideBarAction:
         # - idx_dict을 API에서 message로 이미 만들었으므로, 조작안함
         mask, msg, _ = modify_bulk_signup(idxes=idxes, way=way)
         # 수정 후 액션
-        cls.after_modify(mask, msg)
+        cls.after_modify(mask, msg, diff=("signup", idxes, way))
 
     @classmethod
     def block(cls, way: bool):
@@ -365,7 +483,7 @@ class SideBarAction:
         # - idx_dict을 API에서 message로 이미 만들었으므로, 조작안함
         mask, msg, _ = modify_bulk_block(idxes=idxes, way=way)
         # 수정 후 액션
-        cls.after_modify(mask, msg)
+        cls.after_modify(mask, msg, diff=("block", idxes, way))
 
     @classmethod
     def delete(cls):
@@ -426,9 +544,9 @@ class SideBarAction:
         Rules
         -----
         - 최소 1개 이상 선택
-        - 관리자 계정이 포함된 경우 거부(AdminUserModify.ADMIN_IDX_LIST)
+        - 모든 idx는 int frozenset으로 1회 변환 (실패 시 거부, 중복 제거)
+        - 관리자 계정이 포함된 경우 거부(AdminUserModify.ADMIN_IDX_LIST, frozenset)
         - 삭제의 경우: soft-delete(정지) 상태인 계정만 허용 (실수 방지)
-        - 모든 idx는 int로 변환되어 반환
 
         Returns
         -------
@@ -439,28 +557,30 @@ class SideBarAction:
         # session에 저장된 index 정보 반환
         idx_list: List[str] =  st.session_state.get(AdminUserModify.INDEX_LIST, [])
 
-        # 비어있거나, 내부에 이상한 값(정수 변환이 안되는)이 있는지 확인
-        if len(idx_list) == 0:
+        # 비어있는지 확인 - 세션의 admin/block 집합을 읽기 전에 바로 종료
+        if not idx_list:
             return None, AdminMsg.NO_IDX_ENTER
-        
-        # 관리자 계정이 포함되어 있는 경우 방어
-        admin_idxes = st.session_state.get(AdminUserModify.ADMIN_IDX_LIST)
-        if len(set(idx_list) & set(admin_idxes)) > 0:
+
+        # 내부에 이상한 값(정수 변환이 안되는)이 있는지 확인
+        # - 정수 변환과 집합 생성을 한 번에 수행 (중복 선택도 함께 제거)
+        try:
+            idx_set = frozenset(map(int, idx_list))
+        except (TypeError, ValueError):
+            return None, AdminMsg.WEIRD_IDX_ENTER
+
+        # 관리자 계정이 포함되어 있는 경우 방어 (세션의 frozenset과 교집합)
+        admin_idxes = st.session_state.get(AdminUserModify.ADMIN_IDX_LIST, frozenset())
+        if idx_set & admin_idxes:
             return None, AdminMsg.DEFENCE_ADMIN_MODIFY
 
         # [delete] Hard-delete를 Soft-delete를 하기 전에 하려고 하는지 확인
         if is_delete:
-            blocked_idxes = st.session_state.get(AdminUserModify.BLOCK_IDX_LIST)
-            # 삭제는 '정지된 사용자'만 허용: 선택된 전체가 BLOCK 목록에 포함되어야 함
-            # idx_list와 bloced_idxes의 교집합은 idx_list와 일치해야함
-            if set(idx_list) & set(blocked_idxes) != set(idx_list):
+            blocked_idxes = st.session_state.get(AdminUserModify.BLOCK_IDX_LIST, frozenset())
+            # 삭제는 '정지된 사용자'만 허용: 선택된 전체가 BLOCK 집합에 포함되어야 함
+            if not idx_set <= blocked_idxes:
                 return None, AdminMsg.NOT_BLOCKED_USER_DELETE
 
-        # 위 문제가 다 해결된 경우 정수로 idx를 변환함
-        try:
-            return [int(i) for i in idx_list], None
-        except:
-            return None, AdminMsg.WEIRD_IDX_ENTER
+        return sorted(idx_set), None
 
     @classmethod
     def _idx_handler(
@@ -472,8 +592,8 @@ class SideBarAction:
         """
         단일 idx 무결성 검사.
         - 정확히 1개 선택
-        - 관리자 계정 방어
         - int 캐스팅 성공
+        - 관리자 계정 방어
 
         Returns
         -------
@@ -493,16 +613,16 @@ class SideBarAction:
             return None, AdminMsg.TOO_MUCH_IDX_ENTER
         
         # idx_list 단위에서 idx로 프로세스 진행
-        idx_str: str = idx_list[0]
+        try:
+            idx = int(idx_list[0])
+        except (TypeError, ValueError):
+            return None, AdminMsg.WEIRD_IDX_ENTER
 
         # 관리자 계정을 선택한 경우 방어
-        if idx_str in st.session_state[AdminUserModify.ADMIN_IDX_LIST]:
+        if idx in st.session_state.get(AdminUserModify.ADMIN_IDX_LIST, frozenset()):
             return None, AdminMsg.DEFENCE_ADMIN_MODIFY
         
-        try:
-            return int(idx_str), None
-        except:
-            return None, AdminMsg.WEIRD_IDX_ENTER
+        return idx, None
 
     @classmethod
     def _password_checker(cls, password: str) -> Tuple[Optional[str], Optional[str]]:
@@ -513,7 +633,8 @@ class SideBarAction:
         -----
         1) str 여부 및 strip()
         2) 빈 문자열 방어
-        3) Pydantic Password 스키마로 형식 검증
+        3) 정규식 사전 필터(PASSWORD_PATTERN)
+        4) Pydantic Password 스키마로 형식 검증
 
         Returns
         -------
@@ -530,48 +651,81 @@ class SideBarAction:
         # 비어있는 비밀번호 입력 시
         if not password:
             return None, AdminMsg.NOT_ENTER_PWD
-        
+
+        # 형식 사전 필터 - 명백히 잘못된 비밀번호는 Pydantic 검증 없이 바로 반환
+        if not PASSWORD_PATTERN.fullmatch(password):
+            return None, AdminMsg.WRONG_FORMAT_PWD
+
         # 비밀번호 형식 확인
         try:
             _PWC = PasswordCheck(pwd=password)
             return _PWC.pwd, None
-        except:
+        except ValidationError:
             return None, AdminMsg.WRONG_FORMAT_PWD
         
     # ------------------------------
     # 공통 후처리 / 인터럽트 메시지
     # ------------------------------
     @classmethod
-    def after_modify(cls, mask: bool, msg: str):
+    def after_modify(
+            cls, 
+            mask: bool, 
+            msg: str, 
+            diff: Optional[Tuple[str, List[int], bool]] = None
+        ):
         """
         공통 후처리:
         - Flash 메시지 저장
-        - DB 재조회(GetTable.base)
-        - 선택 초기화
-        - 전체 화면 갱신(st.rerun)
+        - 전처리 캐시 버전 증가(TABLE_VERSION)
+        - 테이블 갱신
+            - 성공 + diff 있음 : GetTable.apply_diff()로 세션 DF만 갱신 (DB 재조회 없음)
+            - 성공 + diff 없음 : 테이블 내용 변화 없음 (예: 비밀번호 변경)
+            - 실패/오류        : 부분 반영 가능성이 있으므로 DB 재조회(GetTable.base)
+        - 선택 초기화 (TABLE_VERSION이 AgGrid key에 포함되어 표의 선택 상태도 함께 초기화됨)
+        - 화면 갱신(st.rerun) - 실제로 바뀐 상태(dirty)가 있을 때만
+
+        Parameters
+        ----------
+        diff : (kind, idxes, way), optional
+            GetTable.apply_diff()에 전달할 조작 내용
         """
         # 사용자 피드백 - 플래시 저장 (다음 렌더 사이클에 표시)
         if mask is True:
-            Flash.push(flash_key=FlashKeys.ADMIN_TABLE, level="success", msg=msg)
+            dirty = Flash.push(flash_key=FlashKeys.ADMIN_TABLE, level="success", msg=msg)
         elif mask is False:
-            Flash.push(flash_key=FlashKeys.ADMIN_TABLE, level="warning", msg=msg)
+            dirty = Flash.push(flash_key=FlashKeys.ADMIN_TABLE, level="warning", msg=msg)
         else:
-            Flash.push(flash_key=FlashKeys.ADMIN_TABLE, level="error", msg=msg)
-
-        # DB 재조회: ALL 기준으로 DB 재조회 -> 현재 뷰 유지
-        GetTable.base()
+            dirty = Flash.push(flash_key=FlashKeys.ADMIN_TABLE, level="error", msg=msg)
+
+        # 데이터가 변경되었으므로 전처리 캐시 무효화
+        st.session_state[AdminUserModify.TABLE_VERSION] = \
+            st.session_state.get(AdminUserModify.TABLE_VERSION, 0) + 1
+        # 테이블 갱신 -> 현재 뷰 유지
+        if mask is not True:
+            # 실패/오류: DB 재조회로 실제 상태와 동기화
+            GetTable.base()
+            dirty = True
+        elif diff is not None and AdminViews.TABLE_ALL in st.session_state:
+            # 성공: 알려진 변경분만 세션 DF에 반영
+            GetTable.apply_diff(*diff)
+            dirty = True
         # 선택된 idxes 정보 초기화
-        st.session_state[AdminUserModify.INDEX_LIST] = []
-        # 화면 갱신
-        st.rerun()
+        if st.session_state.get(AdminUserModify.INDEX_LIST):
+            st.session_state[AdminUserModify.INDEX_LIST] = []
+            dirty = True
+        # 화면 갱신 - 변경된 상태가 있을 때만
+        if dirty:
+            st.rerun()
 
     @classmethod
-    def interupt_flash_msg(cls, msg: str):
+    def interupt_flash_msg(cls, msg: str, force: bool = False):
         """
         조작 전단계 방어/검증 실패 등으로 액션을 중단할 때,
         사용자에게 경고성 Flash를 남기고 화면을 다시 그린다.
+        - 같은 경고가 이미 대기 중이면(중복 클릭) rerun하지 않는다. (force=True면 항상 rerun)
         """
         # 사용자 피드백 - 플래시 저장 (다음 렌더 사이클에 표시)
-        Flash.push(flash_key=FlashKeys.ADMIN_TABLE,level="warning", msg=msg)
-        # 화면 갱신
-        st.rerun()
\ No newline at end of file
+        pushed = Flash.push(flash_key=FlashKeys.ADMIN_TABLE,level="warning", msg=msg)
+        # 화면 갱신 - 새 경고가 저장되었을 때만
+        if pushed or force:
+            st.rerun()
\ No newline at end of file
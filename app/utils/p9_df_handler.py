@@ -1,5 +1,5 @@
-from typing import Tuple, List, Dict, Union, Optional, Literal
-from datetime import datetime
+from typing import Tuple, List, Dict, Union, Optional, Literal, Iterable
+from datetime import datetime, timezone
 
 import streamlit as st
 import pandas as pd
@@ -14,6 +14,99 @@ from app.constants.messages import AdminMsg
 # API로부터 전달받는 단일 레코드 타입
 Record = dict[str, Union[str, int, bool, datetime, None]]
 
+# 값 종류가 고정된 표시 컬럼 → 범주형 dtype (행당 int8 코드, 문자열 비교가 코드 비교로 바뀜)
+# 카테고리를 고정해 두어 일부 값만 존재하는 테이블에서도 이후 값 갱신이 가능하도록 한다.
+_BOOL_STR_DTYPE: pd.CategoricalDtype = pd.CategoricalDtype(["False", "True"])
+_CATEGORY_DTYPES: Dict[str, pd.CategoricalDtype] = {
+    # 승인여부는 미신청(signup=None) 값을 문자열화한 "None"도 그대로 표시
+    "승인여부": pd.CategoricalDtype(["None", "False", "True"]),
+    "정지여부": _BOOL_STR_DTYPE,
+    "권한": pd.CategoricalDtype(["user", "developer", "admin"]),
+}
+
+# UsersRecord에 정의된 레코드 컬럼 (UsersRecord의 문자열 속성만, 정의 순서 유지, import 시 1회 계산)
+_RECORD_COLUMNS: Tuple[str, ...] = tuple(
+    v for k, v in UsersRecord.__dict__.items()
+    if not k.startswith("__") and isinstance(v, str)
+)
+# 검증용 집합
+_EXPECTED_COLS: frozenset = frozenset(_RECORD_COLUMNS)
+
+# 가중치가 0이 아닌 역할 컬럼 / 가중치 벡터 (ROLE_COL_DICT는 런타임에 변하지 않으므로 import 시 1회 계산)
+_ROLE_COLUMNS: Tuple[str, ...] = tuple(
+    k for k, v in AdminUserTable.ROLE_COL_DICT.items() if v != 0
+)
+_ROLE_WEIGHTS: np.ndarray = np.array(
+    [AdminUserTable.ROLE_COL_DICT[c] for c in _ROLE_COLUMNS], dtype=np.int8
+)
+
+# 최종 결과 컬럼 순서 (빈 records 빠른 경로(UserTable._empty_frame)에서 사용 - _all_process의 결합 순서와 동일)
+_RESULT_COLUMNS: Tuple[str, ...] = tuple(
+    AdminUserTable.RESULT_NEW_COLUMN_NAMES.get(c, c) for c in (
+        *AdminUserTable.RESULT_ORIGIN_COLUMNS,
+        AdminUserTable.DT_INTERVAL_COL.format(col="signup_at"),
+        "정지여부",
+        AdminUserTable.DT_INTERVAL_COL.format(col="deleted_at"),
+        AdminUserTable.ROLE_STRING_COL,
+    )
+)
+
+# 레코드 컬럼별 dtype (컬럼 단위로 배열을 바로 만들 때 사용)
+# - idx → int64, 역할 플래그 → bool, 그 외(문자열·시각 문자열) → object
+# - signup은 None(미신청)과 False(승인 대기)를 구분해야 하므로 bool로 변환하지 않고 object 유지
+# - _RECORD_COLUMNS 순서를 따르므로 생성되는 DataFrame의 컬럼 순서가 항상 같다
+_DTYPE_MAP: Dict[str, type] = {
+    **dict.fromkeys(_RECORD_COLUMNS, object),
+    UsersRecord.idx: np.int64,
+    UsersRecord.developer: np.bool_,
+    UsersRecord.admin: np.bool_,
+}
+
+
+# ==============================
+# 전처리 캐시
+# ==============================
+# 캐시 키로 사용할 레코드 필드 - 관리자 조작으로 바뀌는 값 + 갱신 시각(그 외 정보 수정 반영)
+_FINGERPRINT_FIELDS: Tuple[str, ...] = (
+    UsersRecord.idx, UsersRecord.updated_at,
+    UsersRecord.signup, UsersRecord.signup_at, UsersRecord.deleted_at,
+)
+
+
+def _records_fingerprint(records: List[Record]) -> int:
+    """
+    records 전체 payload 대신 _FINGERPRINT_FIELDS만 훑어 캐시 키 해시를 만든다. (O(N))
+    """
+    return hash(tuple(
+        tuple(r.get(f) for f in _FINGERPRINT_FIELDS) for r in records
+    ))
+
+
+@st.cache_data(                                     # 동일 records/version이면 pandas 파이프라인 재실행 생략
+    ttl=60,
+    show_spinner=False,
+    max_entries=4,
+    hash_funcs={list: _records_fingerprint}
+)
+def _build_user_df(records: List[Record], version: int) -> pd.DataFrame:
+    """
+    원시 records → 관리자 테이블 DataFrame (캐시 래퍼).
+
+    Parameters
+    ----------
+    records : List[Record]
+        get_all_user_records()가 반환한 원시 레코드 (_records_fingerprint로 캐시 키 생성)
+    version : int
+        세션의 AdminUserModify.TABLE_VERSION 값.
+        조작(after_modify) 시 증가하여 이전 결과를 명시적으로 무효화한다.
+
+    Notes
+    -----
+    - 캐시 hit 시 함수 본문이 실행되지 않으므로, 세션 기록 같은 부수효과는 두지 않는다.
+    - 캐시 키에 없는 필드만 바뀐 경우를 대비해 ttl(60초)로 보관 기간을 제한한다.
+    """
+    return UserTable._all_process(records=records)
+
 
 # ==============================
 # 데이터 조회
@@ -37,6 +130,8 @@ class UserTable:
     Notes
     -----
     - 전처리 결과는 FE(AgGrid) 표시 최적화를 위해 문자열화가 포함된다.
+    - 전처리는 _build_user_df()로 캐싱되며(records + TABLE_VERSION 기준),
+      변경이 없으면 재조회 시에도 pandas 파이프라인을 다시 실행하지 않는다.
     - 세션에 보안/UX 방어용 인덱스 목록(AdminUserModify.*_IDX_LIST)도 함께 기록한다.
     """
     @classmethod
@@ -47,25 +142,44 @@ class UserTable:
         처리 개요
         --------
         1) get_all_user_records()로 원시 records 조회
-        2) 비정상/빈 응답 방어
-        3) _all_process()로 컬럼 검증, 시간/권한 가공, 정렬/리네이밍
-        4) 실패 시 관리자 메시지로 예외 내용을 포함해 반환
+        2) 비정상 응답 방어 (빈 응답은 파이프라인 없이 결과 스키마의 빈 DF 반환)
+        3) _build_user_df()(캐시) → _all_process()로 컬럼 검증, 시간/권한 가공, 정렬/리네이밍
+        4) 주요 idx 목록 세션 저장 (캐시 hit 여부와 무관하게 매번 수행)
+        5) 실패 시 관리자 메시지로 예외 내용을 포함해 반환
         """
         # 1) DB/백엔드 조회
         mask, msg, records = get_all_user_records()
 
-        # 2) 비정상 또는 빈 결과 방어
-        if not mask or not records:
+        # 2) 비정상 결과 방어
+        if not mask:
             return mask, msg, None
-        # 3) 전처리 파이프라인 실행
+        # 3) 전처리 파이프라인 실행 (캐시) - 빈 결과는 검증/파싱/변환 없이 결과 스키마만 구성
         try:
-            df = cls._all_process(records=records)
+            if not records:
+                df = cls._empty_frame()
+            else:
+                df = _build_user_df(
+                    records=records,
+                    version=st.session_state.get(AdminUserModify.TABLE_VERSION, 0)
+                )
+            # 4) FE 방어를 위한 주요 idx 추출(세션 저장)
+            cls._key_idxes_add_to_session(df=df)
             return mask, msg, df
-        # 4) 전처리 중 예외 발생 시: 관리자 페이지 특성상 오류 그대로 노출
+        # 5) 전처리 중 예외 발생 시: 관리자 페이지 특성상 오류 그대로 노출
         except Exception as e:
             return False, AdminMsg.DATA_HANDLING_FAIL.format(e=e), None
 
     # ----------------- 내부 파이프라인 -----------------
+    @classmethod
+    def _empty_frame(cls) -> pd.DataFrame:
+        """
+        _all_process() 결과와 같은 컬럼 순서/dtype의 0행 DataFrame을 반환한다.
+        (DB에 사용자가 없는 경우 FE가 None 대신 빈 표를 받도록 함)
+        """
+        return pd.DataFrame(
+            {c: pd.Series(dtype="str") for c in _RESULT_COLUMNS}
+        ).astype(_CATEGORY_DTYPES)
+
     @classmethod
     def _all_process(cls, records: List[Record]) -> pd.DataFrame:
         """
@@ -76,51 +190,70 @@ class UserTable:
         - DataFrame 변환 및 컬럼 무결성 검증(누락/초과)
         - 시간 처리: deleted_at·signup_at 기준 경과 시간 계산(+ 정지여부 파생)
         - 권한 처리: 복수 role 컬럼 → 가중합 → 최종 문자열 라벨
-        - 필요한 원본 컬럼 + 파생 컬럼 병합
+        - 필요한 원본 컬럼 + 파생 컬럼 결합 (행 순서 그대로 컬럼 직접 대입)
         - 컬럼명 리네이밍, 전체 문자열화, idx zero-padding 등 표시 정리
+        - 승인여부/정지여부/권한 컬럼 범주형(category) 변환
         """
-        # records → DataFrame
-        df = pd.DataFrame.from_records(records)
+        # 필수/허용 컬럼 검증 - DataFrame 생성 전에 레코드 키만으로 (부족/초과 모두 감지)
+        Checker.user_record_keys(records=records)
 
-        # 필수/허용 컬럼 검증 (부족/초과 모두 감지)
-        Checker.user_record_column_names(df=df)
+        # records → DataFrame (컬럼 단위로 타입이 정해진 배열을 바로 구성)
+        df = cls._records_to_frame(records)
 
-        # ---- 시간 처리: 경과 시간/정지여부 파생 ----
-        deleted_at_df = TimeHandler.interval_time(df, time_col="deleted_at")
-        signup_at_df = TimeHandler.interval_time(df, time_col="signup_at")
-        
-        # ---- 권한 처리: 임의 개수의 role 컬럼 가중합 → 문자열 라벨 ----
-        role_df = FormatHandler.role_handler(df)
-
-        # ---- 원본 필요컬럼 + 시간/권한 컬럼 병합 ----
-        out: pd.DataFrame = (
-            df.loc[:, AdminUserTable.RESULT_ORIGIN_COLUMNS]
-            .merge(signup_at_df, on=UsersRecord.idx, how="left")
-            .merge(deleted_at_df, on=UsersRecord.idx, how="left")
-            .merge(role_df, on=UsersRecord.idx, how="left")
-        )
+        # ---- 원본 필요컬럼 ----
+        out: pd.DataFrame = df.loc[:, AdminUserTable.RESULT_ORIGIN_COLUMNS]
+
+        # ---- 시간 처리: 경과 시간/정지여부 파생 (행 순서 그대로 직접 대입) ----
+        # 파생 결과는 모두 df와 같은 행 순서의 배열이므로 idx 기준 join이 필요 없다
+        times = TimeHandler.interval_batch(df, time_cols=("signup_at", "deleted_at"))
+        for col, values in times.items():
+            out[col] = values
+
+        # ---- 권한 처리: 임의 개수의 role 컬럼 가중합 → 문자열 라벨 (행 순서 그대로 직접 대입) ----
+        out[AdminUserTable.ROLE_STRING_COL] = FormatHandler.role_handler(df)
         # ---- AgGrid/FE 표시를 위한 후처리 ----
         out = FormatHandler.df_final_cleaner(df=out)
-
-        # --- FE 방어를 위한 주요 idx 추출(세션 저장) ---
-        cls._key_idxes_add_to_session(df=out)
-        return out
+        # ---- 필터 대상 컬럼 범주형 변환 (값은 "True"/"False"/라벨 문자열 그대로 유지) ----
+        return out.astype(_CATEGORY_DTYPES)
     
+    @classmethod
+    def _records_to_frame(cls, records: List[Record]) -> pd.DataFrame:
+        """
+        records(list[dict])를 컬럼 단위로 모아 _DTYPE_MAP의 dtype으로 DataFrame을 만든다.
+
+        Notes
+        -----
+        - from_records의 행 단위 dtype 추론을 거치지 않고, 컬럼당 1회 배열을 만든다.
+        - bool 컬럼(developer/admin)의 결측(None)은 False로 취급된다. (signup은 object라 None 유지)
+        """
+        return pd.DataFrame({
+            col: np.asarray([r.get(col) for r in records], dtype=dtype)
+            for col, dtype in _DTYPE_MAP.items()
+        })
+
     @classmethod
     def _key_idxes_add_to_session(cls, df: pd.DataFrame):
         """
-        FE 조작 방어/UX를 위한 인덱스 목록을 세션에 저장한다.
+        FE 조작 방어/UX를 위한 인덱스 집합을 세션에 저장한다.
 
         - ADMIN_IDX_LIST : '관리자' 계정 idx(수정 금지)
         - BLOCK_IDX_LIST : '정지된' 계정 idx(하드삭제 허용 대상)
+
+        Notes
+        -----
+        - 테이블 조회 시 1회만 frozenset[int]로 만들어 두어,
+          조작 버튼마다 집합을 다시 만들지 않고 바로 `in`/`&` 검사를 하도록 한다.
         """
+        # idx는 1회만 정수 배열로 변환하고, 두 마스크로 바로 인덱싱한다
+        idx_arr = df[UsersRecord.idx].to_numpy().astype(np.int64)
         # [목적] 관리자 유저는 관리자 페이지에서 수정 불가
-        st.session_state[AdminUserModify.ADMIN_IDX_LIST] = \
-            df[df['권한'] == "admin"]["idx"].to_list()
-        
+        st.session_state[AdminUserModify.ADMIN_IDX_LIST] = frozenset(
+            idx_arr[(df['권한'] == "admin").to_numpy()].tolist()
+        )
         # [목적] Hard-delete는 Soft-delete가 된 유저만 허가
-        st.session_state[AdminUserModify.BLOCK_IDX_LIST] = \
-            df[df['정지여부'] == "True"]["idx"].to_list()
+        st.session_state[AdminUserModify.BLOCK_IDX_LIST] = frozenset(
+            idx_arr[(df['정지여부'] == "True").to_numpy()].tolist()
+        )
 
 
 
@@ -138,16 +271,37 @@ class TimeHandler:
     주의
     ----
     - NaT(파싱 실패/결측)는 '현재 - NaT'가 NaT가 되므로,
-      DT_SHOW_ONLY_DATE=True일 때 .dt.days가 NA가 될 수 있다.
+      DT_SHOW_ONLY_DATE=True일 때 일수가 NA(Int64)가 될 수 있다.
       (현 구현은 그대로 노출; 필요시 fillna 정책을 추가 고려)
     """
 
+    @classmethod
+    def interval_batch(
+            cls,
+            df: pd.DataFrame,
+            time_cols: Tuple[str, ...]
+        ) -> Dict[str, Union[np.ndarray, pd.arrays.IntegerArray, pd.Series]]:
+        """
+        여러 time_col의 경과 시간을 같은 기준 시각(now, 1회 계산)으로 한 번에 계산한다.
+
+        Returns
+        -------
+        Dict[str, array-like]
+            time_cols 순서대로 interval_time() 결과를 이어붙인 {컬럼명: 값 배열}
+        """
+        now = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), "s")
+        out: Dict[str, Union[np.ndarray, pd.arrays.IntegerArray, pd.Series]] = {}
+        for time_col in time_cols:
+            out.update(cls.interval_time(df, time_col=time_col, now=now))
+        return out
+
     @classmethod
     def interval_time(
             cls, 
             df: pd.DataFrame, 
-            time_col: Literal['created_at', 'signup_at', 'updated_at', 'deleted_at']
-        ) -> pd.DataFrame:
+            time_col: Literal['created_at', 'signup_at', 'updated_at', 'deleted_at'],
+            now: Optional[np.datetime64] = None
+        ) -> Dict[str, Union[np.ndarray, pd.arrays.IntegerArray, pd.Series]]:
         """
         지정된 time_col에 대한 경과 시간을 계산한다.
 
@@ -157,11 +311,13 @@ class TimeHandler:
             원본 데이터프레임
         time_col : {'created_at','signup_at','updated_at','deleted_at'}
             경과 시간을 계산할 datetime 컬럼명(사전정의된 허용 목록)
+        now : np.datetime64, optional
+            기준 시각(UTC, 초 단위). 없으면 호출 시점으로 계산
 
         Returns
         -------
-        pd.DataFrame
-            [UsersRecord.idx, f"{time_col}_interval"] (+ '정지여부'@deleted_at)로 구성.
+        Dict[str, array-like]
+            {('정지여부'@deleted_at,) f"{time_col}_interval"} → df와 같은 행 순서의 값 배열.
 
         Raises
         ------
@@ -173,87 +329,61 @@ class TimeHandler:
             raise ValueError(
                     f"{time_col}은 Users Table에서 반환하는 값에 해당하지 않습니다!"
                 )
-        # deleted_at인 경우, '정지여부' 파생
-        if time_col == 'deleted_at':
-            df['정지여부'] = ~df["deleted_at"].isna()
-            column_list = [UsersRecord.idx, '정지여부', time_col]
-        else:
-            column_list = [UsersRecord.idx, time_col]
-
-        # 계산 대상 최소 컬럼만 추출
-        t_df = df[column_list].copy()
+        # 경과 시간 계산 (원본 DF 복사 없이 대상 컬럼만 numpy로 처리)
+        interval_col = AdminUserTable.DT_INTERVAL_COL.format(col=time_col)
+        if now is None:
+            now = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), "s")
+        interval = cls._interval_array(s=df[time_col], now=now)
 
-        # 내부 처리
-        t_df = cls._t_df_handler(t_df=t_df, time_col=time_col)
-        return t_df
+        # deleted_at인 경우, '정지여부' 파생 (원본 DF에 컬럼을 추가하지 않고 배열로만 계산)
+        if time_col == 'deleted_at':
+            return {
+                '정지여부': ~df["deleted_at"].isna().to_numpy(),
+                interval_col: interval
+            }
+        return {interval_col: interval}
 
     @classmethod
-    def _t_df_handler(cls, t_df: pd.DataFrame, time_col: str) -> pd.DataFrame:
+    def _interval_array(
+            cls, 
+            s: pd.Series, 
+            now: np.datetime64
+        ) -> Union[pd.arrays.IntegerArray, pd.Series]:
         """
         단일 datetime 컬럼에 대해 UTC 기준 경과 시간을 계산하고 표준 포맷으로 변환한다.
 
         Steps
         -----
-        1) 문자열/None → datetime(UTC) 변환(errors='coerce'로 NaT 허용)
-        2) now(UTC) - 대상시각 → Timedelta 계산
+        1) ISO8601 문자열/None → datetime64[s](UTC) 1회 파싱 (errors='coerce'로 NaT 허용)
+        2) now(UTC) - 대상시각 → timedelta64[s] (초 단위이므로 별도 floor 불필요)
         3) AdminUserTable.DT_SHOW_ONLY_DATE 정책에 맞춰 포맷 통일
+           - True  → 일 단위 Int64 (NaT는 NA 유지)
+           - False → Timedelta 유지(결측은 NaT)
         """
-        # 신규 생성 컬럼명 (원본 문자열 파싱 결과, 경과 시간)
-        dt_col, interval_col = cls._get_time_column_names(time_col)
-
-        # 문자열/None → datetime(UTC) 안전 파싱 (파싱 실패 시 NaT)
-        t_df[dt_col] = pd.to_datetime(t_df[time_col], utc=True, errors="coerce")
+        # 전부 결측(예: 아무도 정지되지 않음)이면 파싱/뺄셈 없이 결측 결과 바로 반환
+        if s.isna().all():
+            n = len(s)
+            if AdminUserTable.DT_SHOW_ONLY_DATE:
+                return pd.arrays.IntegerArray(np.zeros(n, dtype=np.int64), np.ones(n, dtype=bool))
+            return pd.Series(np.full(n, np.timedelta64("NaT", "s")))
+
+        # ISO8601 문자열/None → datetime64[s](UTC, tz 제거) 안전 파싱 (파싱 실패 시 NaT)
+        # - format 지정으로 행별 형식 추론 없이 ISO8601 고속 경로 사용
+        arr = pd.to_datetime(
+            s, utc=True, errors="coerce", format="ISO8601"
+        ).to_numpy(dtype="datetime64[s]")
 
         # 경과 시간 = '현재(UTC) - 대상시각(UTC)'
-        t_df[interval_col] = pd.Timestamp.now(tz="UTC") - t_df[dt_col]
-
-        # 표준 포맷으로 통일 (일 Int 또는 Timedelta)
-        t_df[interval_col] = cls._interval_format(s=t_df[interval_col])
-
-        # 최소 컬럼만 반환
-        if time_col == 'deleted_at':
-            return t_df[[UsersRecord.idx, '정지여부', interval_col]]
-        return t_df[[UsersRecord.idx, interval_col]]
-    
-    @classmethod
-    def _interval_format(cls, s: pd.Series) -> pd.Series:
-        """
-        경과 시간 Series를 표준 포맷으로 변환한다.
-
-        규칙
-        ----
-        - 마이크로초 절삭(초 단위로 고정)
-        - DT_SHOW_ONLY_DATE=True  → .dt.days(Int64, NA 가능)
-        - False → Timedelta 유지(결측은 NaT 기반; 필요 시 별도 fill 정책 고려)
-        """
-        # 마이크로초 제거 (초 단위 정렬)
-        s = s.dt.floor("s")
+        delta = now - arr
 
         if AdminUserTable.DT_SHOW_ONLY_DATE:
-            # 예: '3 days 04:12:10' → 3
-            # (Int64로 두어 NA 유지; 필요 시 .fillna(0) 등 정책 적용 가능)
-            return s.dt.days
-        
-        # Timedelta 유지(표시 목적; 필요 시 .fillna(pd.Timedelta(0)) 고려)
-        return s
-
-    @classmethod
-    def _get_time_column_names(cls, time_col: str) -> Tuple[str, str]:
-        """
-        time_col에 대응하는 파생 컬럼명 쌍(dt_col, interval_col)을 생성한다.
+            # 예: '3 days 04:12:10' → 3 (초 → 일 정수 나눗셈, NaT는 NA 마스크로 보존)
+            nat = np.isnat(delta)
+            days = np.where(nat, 0, delta.astype("int64") // 86400)
+            return pd.arrays.IntegerArray(days, nat)
 
-        Returns
-        -------
-        dt_col : str
-            파싱된 datetime 저장 컬럼명
-        interval_col : str
-            현 시점까지의 경과 시간 저장 컬럼명
-        """
-        # datetime 변수명 (dtype = datetime)
-        dt_col = AdminUserTable.DT_ADD_COL.format(col=time_col)
-        # 현재 시간까지 datetime 간격 변수명
-        interval_col = AdminUserTable.DT_INTERVAL_COL.format(col=time_col)
-        return dt_col, interval_col
+        # Timedelta 유지(표시 목적; 필요 시 .fillna(pd.Timedelta(0)) 고려)
+        return pd.Series(delta)
 
 
 
@@ -264,123 +394,39 @@ class FormatHandler:
 
     주의
     ----
-    - 현재 구현은 '역할 컬럼이 2개'라는 전제를 둔 단순 가중합 방식.
-      (AdminUserTable.ROLE_COL_DICT에서 값이 0이 아닌 항목 2개 가정)
-    - 역할 컬럼이 추가될 가능성이 있다면 sum(...) 기반으로 일반화 필요.
+    - 가중합은 (N행 x 역할수) bool 행렬과 가중치 벡터의 곱으로 한 번에 계산한다.
+      역할 컬럼 개수와 무관하게 동작한다.
+    - 라벨은 합계를 0~2로 clip하여 _ROLE_LABELS에서 조회한다.
+      (ROLE_COL_DICT의 가중치 체계가 바뀌면 라벨 규칙도 함께 조정해야 한다.)
     """
+    # 합산 숫자 → 라벨 조회표 (0: user, 1: developer, 2 이상: admin)
+    _ROLE_LABELS: np.ndarray = np.array(["user", "developer", "admin"], dtype=object)
 
     @classmethod
     def role_handler(
             cls, 
             df: pd.DataFrame
-        ) -> pd.DataFrame:
+        ) -> np.ndarray:
         """
         역할 관련 원본 컬럼들 → 가중합 숫자 → 최종 문자열 라벨로 변환한다.
 
-        Returns
-        -------
-        pd.DataFrame
-            [UsersRecord.idx, AdminUserTable.ROLE_STRING_COL] 만 포함
-        """
-        # 1) 역할 컬럼 목록 수집 (가중치가 0이 아닌 것만)
-        role_columns: List[str] = cls._get_role_column_list()
-
-        # 2) 최소 컬럼만 추출 (role 관련)
-        r_df: pd.DataFrame = df[[UsersRecord.idx] + role_columns].copy()
-
-        # 3) 역할 True/False → 가중치 숫자 컬럼으로 치환
-        r_df = cls._make_role_number_column(role_columns, r_df)
-
-        # 4) 숫자 컬럼 합산 (※ 현재 2개 컬럼 전제)
-        r_df = cls._plus_role_number_columns(role_columns, r_df)
-
-        # 5) 합산 숫자 → 문자열 라벨(user/developer/admin)
-        r_df = cls._total_role_number_convert_to_string(r_df)
-        
-        return r_df[[UsersRecord.idx, AdminUserTable.ROLE_STRING_COL]]
-
-    @classmethod
-    def _get_role_column_list(cls) -> List[str]:
-        """
-        ROLE_COL_DICT에서 가중치가 0이 아닌 역할 컬럼명만 추출.
+        Steps
+        -----
+        1) 역할 컬럼(bool)을 int8 2차원 배열로 추출
+        2) 가중치 벡터와 행렬곱 → 행별 가중합
+        3) 가중합을 0~2로 clip하여 라벨 조회표에서 문자열 선택
 
         Returns
         -------
-        List[str]
-            표시/합산 대상 역할 컬럼 리스트
-        """
-        stack  = []
-        for key, value in AdminUserTable.ROLE_COL_DICT.items():
-            if value != 0:
-                stack.append(key)
-        return stack
-
-    @classmethod
-    def _make_role_number_column(
-            cls, role_columns: List[str], r_df: pd.DataFrame
-        ) -> pd.DataFrame:
-        """
-        각 역할 컬럼을 대응 가중치 숫자로 치환하여
-        '{ROLE_NUM_COL.format(col=...)}' 이름의 새 컬럼에 저장한다.
-        """
-        for column in role_columns:
-            # 대상 role 컬럼 Series
-            s = r_df[column]
-            # role_columns_dict에 배정되어 있는 값으로 치환
-            r_df[AdminUserTable.ROLE_NUM_COL.format(col=column)] = np.where(
-                s, AdminUserTable.ROLE_COL_DICT[column], 0
-            )
-        return r_df
-    
-    @classmethod
-    def _plus_role_number_columns(
-            cls, role_columns: List[str], r_df: pd.DataFrame
-        ) -> pd.DataFrame:
-        """
-        숫자 역할 컬럼들을 합산하여 AdminUserTable.ROLE_NUM_TOTAL_COL 에 저장한다.
-
-        현재 구현은 'role_columns가 정확히 2개'라는 전제 하에 동작한다.
-        (예: developer, admin 두 축)
-
-        Notes
-        -----
-        - 역할 종류 확장 시: sum([...]) 형태로 일반화 필요
-        """
-        # 두 number 컬럼을 합친다
-        r_df[AdminUserTable.ROLE_NUM_TOTAL_COL] = (
-            r_df[AdminUserTable.ROLE_NUM_COL.format(col=role_columns[0])] + 
-            r_df[AdminUserTable.ROLE_NUM_COL.format(col=role_columns[1])]
-        )
-        return r_df
-    
-    @classmethod
-    def _total_role_number_convert_to_string(
-            cls,
-            r_df: pd.DataFrame
-        ) -> pd.DataFrame:
+        np.ndarray
+            df와 같은 행 순서의 라벨 배열(object) - 호출부에서 컬럼으로 직접 대입
         """
-        합산된 숫자 역할값을 최종 문자열 라벨로 변환한다.
+        # 1~2) 역할 True/False 행렬 x 가중치(모듈 상수) → 행별 가중합 (단일 연산)
+        totals = df[list(_ROLE_COLUMNS)].to_numpy(dtype=np.int8) @ _ROLE_WEIGHTS
 
-        규칙(예시)
-        ----------
-        - 0 → "user"
-        - 1 → "developer"
-        - 그 외(>=2) → "admin"
+        # 3) 합산 숫자 → 문자열 라벨(user/developer/admin)
+        return cls._ROLE_LABELS[np.clip(totals, 0, 2)]
 
-        ※ ROLE_COL_DICT의 가중치 체계가 바뀌면 본 규칙도 함께 조정해야 한다.
-        """
-        # 0과 1인 경우, 지정된 값을 배정하고 그 외엔 admin을 배정한다
-        r_df[AdminUserTable.ROLE_STRING_COL] = np.where(
-            r_df[AdminUserTable.ROLE_NUM_TOTAL_COL].values == 0, 
-            "user",
-            np.where(
-                r_df[AdminUserTable.ROLE_NUM_TOTAL_COL].values == 1, 
-                "developer", 
-                "admin"
-            )
-        )
-        return r_df
-    
     @classmethod
     def df_final_cleaner(
             cls, 
@@ -407,16 +453,14 @@ class FormatHandler:
         #     kind="stable"
         # ).reset_index(drop=True)
         
-        # idx 컬럼 zero-padding 기준 계산(자릿수 고정)
-        idx_max_size = len(str(df[UsersRecord.idx].max()))
+        # idx 컬럼 zero-padding 기준 계산(자릿수 고정) - 문자열화 전 정수 최댓값 기준
+        idx_max_size = len(str(int(df[UsersRecord.idx].max())))
 
         # 모든 컬럼 문자열 변환 - Streamlit 렌더링/정렬에 유리
         df = cls._all_column_convert_to_string(df)
 
         # idx zero-padding 적용 (문자열 정렬시 '1, 2, 10' 깨짐 방지)
-        df[UsersRecord.idx] = [
-            i.zfill(idx_max_size) for i in df[UsersRecord.idx]
-        ]
+        df[UsersRecord.idx] = df[UsersRecord.idx].str.zfill(idx_max_size)
         return df
 
     @classmethod
@@ -431,18 +475,16 @@ class FormatHandler:
         -----
         - FE 렌더 안정성을 높이고, 혼합 dtype으로 인한 필터/정렬 이슈를 줄인다.
         - 숫자/날짜의 본래 dtype은 잃지만, 이 테이블은 '표시 용도'임을 전제로 한다.
+        - 컬럼별 재대입 루프 대신 DataFrame.astype 1회로 전체 블록을 변환한다.
         """
-        for column in df.columns:
-            df[column] = df[column].astype('str')
-
-        return df
+        return df.astype('str')
     
             
 
 
 class Checker:
     """
-    입력 DataFrame의 컬럼 무결성 검증 유틸리티.
+    입력 레코드의 컬럼 무결성 검증 유틸리티.
 
     검증 항목
     --------
@@ -450,12 +492,25 @@ class Checker:
     - 초과 컬럼: 예상 외 컬럼 존재 시 경고성 KeyError (정책적으로 허용/무시할지 선택)
     """
 
+    @classmethod
+    def user_record_keys(cls, records: List[Record]):
+        """
+        DataFrame을 만들기 전에 records의 키만으로 컬럼 무결성을 검증한다.
+
+        Notes
+        -----
+        - 첫 레코드만 보지 않고 전체 레코드 키의 합집합을 사용한다.
+          (일부 레코드에만 있는 초과 키도 감지 / 기존 from_records 기준 검증과 동일한 범위)
+        - 계약이 깨진 응답이면 N행 DataFrame을 할당하기 전에 KeyError로 중단된다.
+        """
+        cls.user_record_column_names(columns=frozenset().union(*records))
+
     @classmethod
     def user_record_column_names(
-            cls, df: pd.DataFrame
+            cls, columns: Iterable[str]
         ):
         """
-        UsersRecord에 정의된 컬럼 집합과 DataFrame의 컬럼 집합을 비교해
+        UsersRecord에 정의된 컬럼 집합과 입력 레코드의 컬럼 집합을 비교해
         누락/초과를 감지한다.
 
         Raises
@@ -464,18 +519,18 @@ class Checker:
             - required 컬럼 누락
             - 예상 외 컬럼 초과
         """
-        # UsersRecord의 문자열 속성만 필수 컬럼으로 간주
-        expected_cols = [
-            v for k, v in UsersRecord.__dict__.items()
-            if not k.startswith("__") and isinstance(v, str)
-        ]
+        # 필수 컬럼은 모듈 상수(_EXPECTED_COLS)와 비교
+        cols = frozenset(columns)
+        # 정상(완전 일치)인 경우 차집합 계산 없이 바로 통과
+        if cols == _EXPECTED_COLS:
+            return
 
         # 누락 컬럼 체크
-        missing_column = list(set(expected_cols) - set(df.columns))
+        missing_column = list(_EXPECTED_COLS - cols)
         if missing_column:
             raise KeyError(f"Users Record에 다음 컬럼이 누락됨: {missing_column}")
 
         # 초과 컬럼 체크 (정책적으로 경고를 예외로 처리)
-        extra_column = list(set(df.columns) - set(expected_cols))
+        extra_column = list(cols - _EXPECTED_COLS)
         if extra_column:
             raise KeyError(f"Users Record에 예상 외 컬럼 존재: {extra_column}")
\ No newline at end of file
@@ -10,11 +10,12 @@ Streamlit 세션 상태(`st.session_state`) 관리 유틸리티.
 2. 역추적(Reverse Lookup): 현재 페이지 키(str)로부터 페이지 번호(Enum)를 찾아 정확한 상태 제어.
 3. 관심사의 분리: 세션 기본값(defaults.py)과 API 로직을 분리하여 유지보수성 확보.
 """
+from copy import copy
+
 import streamlit as st
 
 from app.constants.keys import SessionKey, PageNum, PageKey
 from app.constants.defaults import DEFAULT_SESSION
-from app.api.p2_chat import get_available_models, get_default_model
 
 
 
@@ -47,27 +48,51 @@ class SessControl:
 
         Args:
             force (bool): True일 경우 현재 상태를 무시하고 강제 리셋 (로그아웃 등에서 사용).
-            reset_tools (bool): Tools 관련 세션 초기화
+            reset_tools (bool): Tools 관련 세션 초기화 (최초/강제 초기화 또는 Tools 페이지 이탈 시에만 수행)
         """
         # 현재 세션 내 login을 위한 키가 존재하는지 여부
         mask = SessionKey.LOGGED_IN not in st.session_state
 
-        if reset_tools:
+        # Tools 세션은 Tools 페이지에서만 변경되므로, 최초/강제 초기화 또는 Tools 페이지를 떠난 시점에만 리셋
+        # (set_page_info 이전에 호출되므로 CURRENT_PAGE는 직전 페이지를 가리킴)
+        left_tools = (
+            st.session_state.get(PageKey.CURRENT_PAGE) == PageKey.P_KEY_DICT[PageNum.TOOLS]
+        )
+        if reset_tools and (force or mask or left_tools):
             from app.tools import ToolSessionManager
             ToolSessionManager.clear_all_tool_sessions()
 
         if force or mask:
             cls._init_action()
 
+    @classmethod
+    def init_page(cls, page_num: PageNum, reset_tools: bool = True) -> None:
+        """
+        페이지 공통 세션 부트스트랩.
+
+        - 세션 초기화 → 현재 페이지 정보 갱신 → 모델 정보 로드를 순서대로 수행.
+        - 모든 페이지(pages/*.py) 상단에서 동일한 순서로 호출되던 3단계를 하나로 묶는다.
+
+        Args:
+            page_num (PageNum): 현재 페이지 번호
+            reset_tools (bool): Tools 관련 세션 초기화 여부 (Tools 페이지는 False)
+        """
+        cls.init(reset_tools=reset_tools)       # 세션 상태 초기화 (로그인 정보)
+        cls.set_page_info(page_num=page_num)    # 페이지 상태 session 저장
+        cls.init_model_info()                   # 모델 정보 로드
+
     @classmethod
     def _init_action(cls) -> None:
         """
         세션 기본값 실제 설정.
 
         - app/constants/defaults.py에 정의된 상수 딕셔너리를 사용하여 초기 상태를 구축.
+        - deque 등 가변 기본값이 세션 간에 공유되지 않도록 얕은 복사본을 넣는다.
+        - 기본값 딕셔너리는 모듈 상수(import 시 1회 생성)이며, update 1회로 일괄 반영한다.
         """
-        for key, value in DEFAULT_SESSION.items():
-            st.session_state[key] = value
+        st.session_state.update(
+            {key: copy(value) for key, value in DEFAULT_SESSION.items()}
+        )
 
     @classmethod
     def init_model_info(cls) -> None:
@@ -78,6 +103,20 @@ class SessControl:
         """
         InitModelInfo.run()
 
+    @classmethod
+    def set_view(cls, key: str, value: str) -> None:
+        """
+        화면(View) 상태 키를 갱신한다.
+
+        - 매 rerun마다 같은 값을 다시 쓰지 않도록, 값이 다를 때만 session_state에 기록.
+
+        Args:
+            key (str): View 상태 키 (예: LoginViews.KEY)
+            value (str): 설정할 View 값
+        """
+        if st.session_state.get(key) != value:
+            st.session_state[key] = value
+
     @classmethod
     def set_page_info(cls, page_num: PageNum) -> None:
         """
@@ -181,6 +220,9 @@ class InitModelInfo:
     @classmethod
     def run(cls) -> None:
         """모델 정보 초기화 전체 실행."""
+        # MODEL_IDX는 목록/모델명 로드 후 마지막에 저장되므로, 존재하면 이미 초기화 완료
+        if SessionKey.MODEL_IDX in st.session_state:
+            return
         # 모델 목록 로드
         cls.model_list_in_session()
         # 디폴트 모델명 로드
@@ -197,6 +239,8 @@ class InitModelInfo:
         """
         # 모델 목록이 없는 경우에만 불러온다
         if SessionKey.MODEL_LIST not in st.session_state:
+            # API 모듈(requests 포함)은 최초 조회 시점에만 import
+            from app.api.p2_chat import get_available_models
             st.session_state[SessionKey.MODEL_LIST] = get_available_models()
 
     @classmethod
@@ -208,6 +252,7 @@ class InitModelInfo:
         """
         # default 모델 이름이 없는 경우에만 불러온다
         if SessionKey.MODEL not in st.session_state:
+            from app.api.p2_chat import get_default_model
             st.session_state[
                 SessionKey.MODEL
             ] = get_default_model()
@@ -1,10 +1,14 @@
 import uuid
 import streamlit as st
-from typing import Literal, Optional, Dict, Final
+from typing import Literal, Optional, Dict, Final, Callable
 
 from app.constants.values import FixValues
 
 
+# 공백(" ") → 언더스코어("_") 변환 테이블 (import 시 1회 생성)
+_SPACE_TBL: Final[Dict[int, str]] = str.maketrans({" ": "_"})
+
+
 
 def string_space_converter(value: str) -> str:
     """
@@ -16,17 +20,16 @@ def string_space_converter(value: str) -> str:
 
     Returns:
         str: 공백이 언더스코어로 치환된 문자열 (문자열이 아닌 경우 그대로 반환)
+
+    Notes:
+        - 치환 대상은 ASCII 공백(" ")뿐이다. 탭/전각 공백 등은 호출부에서 먼저 정규화해야 한다.
     """
-    if isinstance(value, str):
-        # 앞뒤 공백 제거
-        value = value.strip()
-        # 빈 문자열이 아니라면 공백을 "_"로 치환
-        if value != "":
-            return value.replace(" ", "_")
-        else:
-            return value
     # 문자열이 아닐 경우 원본 그대로 반환
-    return value
+    if not isinstance(value, str):
+        return value
+    # 앞뒤 공백 제거 후, 빈 문자열이 아니라면 공백을 "_"로 치환 (변환 테이블 1회 적용)
+    value = value.strip()
+    return value.translate(_SPACE_TBL) if value else value
 
 
 def make_request_id(
@@ -132,6 +135,14 @@ class Flash:
     _MSG: Final[str] = "_msg"           # 표시할 메시지 내용
     _LIFE: Final[str] = "_life"         # 유지될 생명주기 (렌더링 가능한 횟수)
 
+    # 메시지 레벨 → Streamlit 출력 함수 (render 시 getattr 조회 생략)
+    _LEVEL_FUNCS: Final[Dict[str, Callable[..., object]]] = {
+        "success": st.success,
+        "warning": st.warning,
+        "error": st.error,
+        "info": st.info,
+    }
+
     @classmethod
     def push(
             cls, 
@@ -139,7 +150,7 @@ class Flash:
             level: Literal['success', 'warning', 'error', 'info'],
             msg: str,
             life: int = FixValues.FLASH_LIFE
-        ):
+        ) -> bool:
         """
         새로운 Flash 메시지를 세션 상태에 저장한다.
 
@@ -148,13 +159,22 @@ class Flash:
             level (Literal): 메시지 수준 (success, warning, error, info)
             msg (str): 사용자에게 표시할 메시지
             life (int): 해당 메시지를 몇 번까지 렌더링할 수 있는지 설정 (기본값: FLASH_LIFE)
+
+        Returns:
+            bool: 새로 저장했으면 True, 같은 레벨/메시지가 이미 대기 중이라 건너뛰었으면 False
         """
+        # 같은 메시지가 이미 대기 중이면 저장 생략 (중복 클릭 시 불필요한 rerun 방지용)
+        pending: Optional[Dict[str, str]] = st.session_state.get(flash_key)
+        if pending and pending[cls._LEVEL] == level and pending[cls._MSG] == msg:
+            return False
+
         # 세션에 Flash 추가
         st.session_state[flash_key] = {
             cls._LEVEL:level, 
             cls._MSG:msg, 
             cls._LIFE:life
         }
+        return True
 
     @classmethod
     def render(cls, flash_key: str):
@@ -164,7 +184,7 @@ class Flash:
         Notes
         -----
         - life가 0이 되면 세션에서 제거된다.
-        - Streamlit의 메시지 출력 함수(getattr(st, level))를 활용한다.
+        - 레벨별 Streamlit 메시지 출력 함수(_LEVEL_FUNCS)를 활용한다.
         """
         # 세션에서 flash 메시지를 꺼냄 (동시에 pop하여 1회 출력 구조)
         data: Optional[Dict[str, str]] = st.session_state.pop(flash_key, None)
@@ -174,10 +194,10 @@ class Flash:
             return
 
         # Streamlit의 레벨별 메시지 함수 (예: st.warning, st.success 등)로 출력
-        getattr(st, data[cls._LEVEL])(data[cls._MSG])
+        cls._LEVEL_FUNCS[data[cls._LEVEL]](data[cls._MSG])
 
-        # life 자동 감소
-        data[cls._LIFE] = int(data.get(cls._LIFE, 1)) - 1
+        # life 자동 감소 (push에서 int로 저장됨)
+        data[cls._LIFE] -= 1
 
         # life가 남아있으면 다시 세션에 저장하여 다음 렌더링까지 유지
         if data[cls._LIFE] > 0:
@@ -36,9 +36,7 @@ basic_ui(title=None)
 #    - 세션 기본키들 미설정 시 기본값 주입
 #    - 모델 목록/기본 모델 등 1회성 메타 정보 로딩
 # ---------------------------------------------------------
-SessControl.init()                                  # 세션 상태 초기화 (로그인 정보)
-SessControl.set_page_info(page_num=PageNum.LOGIN)   # 페이지 상태 session 저장
-SessControl.init_model_info()                       # 모델 정보 로드
+SessControl.init_page(page_num=PageNum.LOGIN)    # 세션/페이지/모델 정보 초기화
 
 
 # ---------------------------------------------------------
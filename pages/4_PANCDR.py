@@ -2,7 +2,6 @@ import streamlit as st
 from app.constants.keys import SessionKey, LoginViews, PageNum
 from app.utils.session import SessControl
 from app.routes.common import GoLogin, basic_ui
-from app.routes.p4_pancdr import Main
 
 
 
@@ -15,9 +14,7 @@ basic_ui(title=None)
 # ---------------------------------------------------------
 # 2. 세션 상태 초기화
 # ---------------------------------------------------------
-SessControl.init()                                      # 세션 상태 초기화 (로그인 정보)
-SessControl.set_page_info(page_num=PageNum.PANCDR)      # 페이지 상태 session 저장
-SessControl.init_model_info()                           # 모델 정보 로드
+SessControl.init_page(page_num=PageNum.PANCDR)    # 세션/페이지/모델 정보 초기화
 
 
 # ---------------------------------------------------------
@@ -26,13 +23,14 @@ SessControl.init_model_info()                           # 모델 정보 로드
 if not st.session_state[SessionKey.LOGGED_IN]:
 
     # 다른 페이지의 View 초기화
-    st.session_state[LoginViews.KEY] = LoginViews.LOGIN_BEFORE
+    SessControl.set_view(LoginViews.KEY, LoginViews.LOGIN_BEFORE)
 
     # 로그인이 되어 있지 않은 경우, 로그인 페이지로 가이드
     GoLogin.UI(title="PANCDR")
 else:
     # 다른 페이지의 View 초기화
-    st.session_state[LoginViews.KEY] = LoginViews.LOGIN_AFTER
+    SessControl.set_view(LoginViews.KEY, LoginViews.LOGIN_AFTER)
 
-    # UI 출력
+    # UI 출력 (화면 모듈은 로그인 후에만 import)
+    from app.routes.p4_pancdr import Main
     Main.UI()
\ No newline at end of file